@@ -8,16 +8,9 @@ import click
 from rich.console import Console
 from rich.table import Table
 
-console = Console()
+from ddogctl.config import REGION_SHORTCUTS
 
-REGION_SHORTCUTS = {
-    "us": "datadoghq.com",
-    "eu": "datadoghq.eu",
-    "us3": "us3.datadoghq.com",
-    "us5": "us5.datadoghq.com",
-    "ap1": "ap1.datadoghq.com",
-    "gov": "ddog-gov.com",
-}
+console = Console()
 
 
 def get_config_dir() -> str:
@@ -62,6 +62,38 @@ def _build_monitor_table(monitors):
     return table
 
 
+def _fetch_monitors(client, tags=None, state=()):
+    """Fetch monitors from the API, optionally filtered by tags and state.
+
+    Args:
+        client: Datadog client.
+        tags: Comma-separated tag filter passed through to the API.
+        state: Overall states to keep (e.g. ("Alert", "Warn")); empty keeps all.
+
+    Returns:
+        List of Datadog monitor objects.
+    """
+    kwargs = {}
+    if tags:
+        kwargs["tags"] = tags
+    monitors = client.monitors.list_monitors(**kwargs)
+    if state:
+        monitors = [m for m in monitors if str(m.overall_state) in state]
+    return monitors
+
+
+def _build_monitor_list(monitors):
+    """Build the JSON-serializable list for ``monitor list --format json``.
+
+    Args:
+        monitors: List of Datadog monitor objects.
+
+    Returns:
+        List of monitor dicts.
+    """
+    return [m.to_dict() for m in monitors]
+
+
 @monitor.command(name="list")
 @click.option("--tags", help="Filter by tags (comma-separated)")
 @click.option(
@@ -85,13 +117,7 @@ def list_monitors(tags, state, format, watch, interval):
 
     def fetch_monitors():
         """Fetch and filter monitors from the API."""
-        kwargs = {}
-        if tags:
-            kwargs["tags"] = tags
-        monitors = client.monitors.list_monitors(**kwargs)
-        if state:
-            monitors = [m for m in monitors if str(m.overall_state) in state]
-        return monitors
+        return _fetch_monitors(client, tags=tags, state=state)
 
     if watch:
 
@@ -117,7 +143,7 @@ def list_monitors(tags, state, format, watch, interval):
             console.print(f"\n[dim]Total monitors: {len(monitors)}[/dim]")
 
         elif format == "json":
-            print(json.dumps([m.to_dict() for m in monitors], indent=2, default=str))
+            print(json.dumps(_build_monitor_list(monitors), indent=2, default=str))
 
         elif format == "markdown":
             print("| ID | State | Name |")
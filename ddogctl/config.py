@@ -10,6 +10,16 @@ from rich.console import Console
 
 console = Console()
 
+# Dogshell-style region shortcuts (lowercase) -> full site domain
+REGION_SHORTCUTS = {
+    "us": "datadoghq.com",
+    "eu": "datadoghq.eu",
+    "us3": "us3.datadoghq.com",
+    "us5": "us5.datadoghq.com",
+    "ap1": "ap1.datadoghq.com",
+    "gov": "ddog-gov.com",
+}
+
 
 def get_config_path() -> str:
     """Return the path to the config file (~/.ddogctl/config.json)."""
@@ -45,39 +55,39 @@ class DatadogConfig(BaseSettings):
     @classmethod
     def expand_region_shortcut(cls, v: str) -> str:
         """Support dogshell-style region shortcuts."""
-        regions = {
-            "us": "datadoghq.com",
-            "eu": "datadoghq.eu",
-            "us3": "us3.datadoghq.com",
-            "us5": "us5.datadoghq.com",
-            "ap1": "ap1.datadoghq.com",
-            "gov": "ddog-gov.com",
-        }
-        return regions.get(v.lower(), v)
-
-
-def _load_profile_data(profile: str | None = None) -> dict | None:
+        # Shortcuts are at most 3 characters; full site domains skip the lowercase copy
+        if len(v) > 3:
+            return v
+        return REGION_SHORTCUTS.get(v.lower(), v)
+
+
+def _load_profile_data(profile: str | None = None, config_data: dict | None = None) -> dict | None:
     """Load profile data from config file.
 
     Args:
         profile: Profile name to load. If None, uses DDOGCTL_PROFILE env var
                  or active_profile from config file.
+        config_data: Already-parsed config file contents. If given, the config
+                     file is not read.
 
     Returns:
         Dict with api_key, app_key, site from the profile, or None if not found.
     """
-    config_path = get_config_path()
+    if config_data is not None:
+        data = config_data
+    else:
+        config_path = get_config_path()
 
-    if not os.path.exists(config_path):
-        if profile:
-            return {"_error": f"Profile '{profile}' not found (config file missing)"}
-        return None
+        if not os.path.exists(config_path):
+            if profile:
+                return {"_error": f"Profile '{profile}' not found (config file missing)"}
+            return None
 
-    try:
-        with open(config_path) as f:
-            data = json.load(f)
-    except (json.JSONDecodeError, OSError):
-        return None
+        try:
+            with open(config_path) as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, OSError):
+            return None
 
     profiles = data.get("profiles", {})
     if not profiles:
@@ -96,7 +106,7 @@ def _load_profile_data(profile: str | None = None) -> dict | None:
     return profiles[profile]
 
 
-def load_config(profile: str | None = None) -> DatadogConfig:
+def load_config(profile: str | None = None, config_data: dict | None = None) -> DatadogConfig:
     """Load and validate configuration.
 
     Priority: CLI flag > env var > active profile > defaults
@@ -104,9 +114,11 @@ def load_config(profile: str | None = None) -> DatadogConfig:
     Args:
         profile: Optional profile name to use. If specified, loads from
                  the named profile in ~/.ddogctl/config.json.
+        config_data: Optional already-parsed config file contents, used
+                     instead of reading ~/.ddogctl/config.json.
     """
     # Try loading from profile (handles CLI flag, DDOGCTL_PROFILE, active_profile)
-    profile_data = _load_profile_data(profile)
+    profile_data = _load_profile_data(profile, config_data)
 
     if profile_data and "_error" in profile_data:
         console.print(f"[red]{profile_data['_error']}[/red]")
@@ -22,6 +22,17 @@ RATE_LIMITED = 5
 SERVER_ERROR = 6
 
 
+# Exact HTTP status matches; any other 5xx falls back to SERVER_ERROR
+_STATUS_MAP = {
+    400: VALIDATION_ERROR,
+    401: AUTH_ERROR,
+    403: AUTH_ERROR,
+    404: NOT_FOUND,
+    422: VALIDATION_ERROR,
+    429: RATE_LIMITED,
+}
+
+
 def exit_code_for_status(status: int) -> int:
     """Map HTTP status code to semantic exit code.
 
@@ -31,15 +42,7 @@ def exit_code_for_status(status: int) -> int:
     Returns:
         Semantic exit code
     """
-    if status in (401, 403):
-        return AUTH_ERROR
-    elif status == 404:
-        return NOT_FOUND
-    elif status in (400, 422):
-        return VALIDATION_ERROR
-    elif status == 429:
-        return RATE_LIMITED
-    elif status >= 500:
-        return SERVER_ERROR
-    else:
-        return GENERAL_ERROR
+    code = _STATUS_MAP.get(status)
+    if code is not None:
+        return code
+    return SERVER_ERROR if status >= 500 else GENERAL_ERROR
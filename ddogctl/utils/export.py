@@ -7,7 +7,8 @@ from pathlib import Path
 def export_to_json(data: dict | list, file_path: str) -> None:
     """Export data to a pretty-printed JSON file.
 
-    Creates parent directories if they don't exist.
+    Creates parent directories if they don't exist. Lists are written one
+    element at a time so large exports never hold the whole document in memory.
 
     Args:
         data: Data to export (dict or list).
@@ -15,4 +16,15 @@ def export_to_json(data: dict | list, file_path: str) -> None:
     """
     path = Path(file_path)
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(data, indent=2, default=str) + "\n")
+    if not isinstance(data, list) or not data:
+        path.write_text(json.dumps(data, indent=2, default=str) + "\n")
+        return
+
+    with path.open("w") as f:
+        f.write("[\n")
+        for i, item in enumerate(data):
+            if i:
+                f.write(",\n")
+            encoded = json.dumps(item, indent=2, default=str)
+            f.write("  " + encoded.replace("\n", "\n  "))
+        f.write("\n]\n")
@@ -6,6 +6,9 @@ import sys
 # Global output format state
 _output_format = "table"
 
+# Lazily created Rich console for table-mode errors
+_stderr_console = None
+
 
 def set_output_format(fmt: str) -> None:
     """Set the global output format."""
@@ -18,6 +21,16 @@ def get_output_format() -> str:
     return _output_format
 
 
+def _get_stderr_console():
+    """Return the shared stderr Rich console, creating it on first use."""
+    global _stderr_console
+    if _stderr_console is None:
+        from rich.console import Console
+
+        _stderr_console = Console(stderr=True)
+    return _stderr_console
+
+
 def emit_error(code: str, status: int, message: str, hint: str = "") -> None:
     """Emit an error in the appropriate format.
 
@@ -35,9 +48,7 @@ def emit_error(code: str, status: int, message: str, hint: str = "") -> None:
             error_obj["hint"] = hint
         print(json.dumps(error_obj), file=sys.stderr)
     else:
-        from rich.console import Console
-
-        console = Console(stderr=True)
+        console = _get_stderr_console()
         console.print(f"[red]{message}[/red]")
         if hint:
             console.print(f"[dim]{hint}[/dim]")
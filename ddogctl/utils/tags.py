@@ -15,11 +15,8 @@ def parse_tags(tags_str: str) -> list[str]:
     if not tags_str:
         return []
 
-    # Split, strip whitespace, deduplicate
-    tags = set(t.strip() for t in tags_str.split(",") if t.strip())
-
-    # Sort for consistency
-    return sorted(tags)
+    # Split, strip each entry once, drop empties and deduplicate; sort for consistency
+    return sorted({t for t in (part.strip() for part in tags_str.split(",")) if t})
 
 
 def format_tags_for_display(tags: list[str], max_tags: int = 3) -> str:
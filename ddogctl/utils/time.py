@@ -1,8 +1,19 @@
 """Time parsing utilities."""
 
-from datetime import datetime, timedelta
+from datetime import datetime
+from functools import lru_cache
 import re
 
+# Relative offsets like "1h", "24h", "7d", "30m"
+_RELATIVE_RE = re.compile(r"(\d+)([hdm])")
+_UNIT_SECONDS = {"m": 60, "h": 3600, "d": 86400}
+
+
+@lru_cache(maxsize=256)
+def _iso_to_epoch(s: str) -> int:
+    """Convert an ISO datetime string to a Unix timestamp, caching repeated inputs."""
+    return int(datetime.fromisoformat(s).timestamp())
+
 
 def parse_time_range(from_str: str, to_str: str = "now") -> tuple[int, int]:
     """Parse time range strings to Unix timestamps.
@@ -17,32 +28,20 @@ def parse_time_range(from_str: str, to_str: str = "now") -> tuple[int, int]:
     Returns:
         Tuple of (from_timestamp, to_timestamp)
     """
-    now = datetime.now()
+    now_ts = int(datetime.now().timestamp())
 
-    def parse_relative(s: str) -> datetime:
+    def parse_relative(s: str) -> int:
         if s == "now":
-            return now
+            return now_ts
 
-        # Match patterns like "1h", "24h", "7d", "30m"
-        match = re.match(r"^(\d+)([hdm])$", s)
+        match = _RELATIVE_RE.fullmatch(s)
         if match:
-            value = int(match.group(1))
-            unit = match.group(2)
-
-            if unit == "h":
-                return now - timedelta(hours=value)
-            elif unit == "d":
-                return now - timedelta(days=value)
-            elif unit == "m":
-                return now - timedelta(minutes=value)
+            return now_ts - int(match.group(1)) * _UNIT_SECONDS[match.group(2)]
 
         # Try parsing as ISO datetime
         try:
-            return datetime.fromisoformat(s)
+            return _iso_to_epoch(s)
         except ValueError:
             raise ValueError(f"Invalid time format: {s}")
 
-    from_dt = parse_relative(from_str)
-    to_dt = parse_relative(to_str)
-
-    return int(from_dt.timestamp()), int(to_dt.timestamp())
+    return parse_relative(from_str), parse_relative(to_str)
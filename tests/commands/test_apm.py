@@ -206,24 +206,11 @@ def test_apm_traces_duration_conversion(mock_client, runner):
         assert output[0]["duration_ms"] == 500.0
 
 
-def test_apm_traces_with_limit(mock_client, runner):
+def test_apm_traces_with_limit(mock_client, runner, sample_spans):
     """Test traces command respects limit parameter."""
     from ddogctl.commands.apm import apm
 
-    now = datetime.now()
-    start = now - timedelta(seconds=5)
-
-    mock_spans = [
-        create_mock_span(
-            f"span{i}",
-            "test-service",
-            f"GET /endpoint{i}",
-            f"trace{i}",
-            start,
-            start + timedelta(milliseconds=100),
-        )
-        for i in range(5)
-    ]
+    mock_spans = list(sample_spans)
     mock_response = Mock(data=mock_spans, meta=Mock(page=Mock(after=None)))
     mock_client.spans.list_spans_get.return_value = mock_response
 
@@ -5,7 +5,9 @@ import os
 import pytest
 from unittest.mock import Mock, patch
 from click.testing import CliRunner
+from datetime import datetime, timezone
 from ddogctl.commands.apply import apply_cmd, diff_cmd, detect_resource_type
+from ddogctl.utils.export import export_to_json
 
 
 @pytest.fixture
@@ -508,6 +510,28 @@ class TestDiffCommand:
         assert result.exit_code == 0
         assert "no differences" in result.output.lower() or "identical" in result.output.lower()
 
+    @patch("ddogctl.commands.apply.get_datadog_client")
+    def test_diff_exported_file_round_trips(self, mock_get_client, mock_client, runner, tmp_path):
+        """A file written by export_to_json diffs clean against the same live object."""
+        mock_get_client.return_value = mock_client
+        live_data = {
+            "id": "abc-123",
+            "title": "Latência — café",
+            "layout_type": "ordered",
+            "widgets": [],
+            "modified_at": datetime(2025, 1, 15, 12, 0, tzinfo=timezone.utc),
+        }
+        live_dash = Mock()
+        live_dash.to_dict.return_value = live_data
+        mock_client.dashboards.get_dashboard.return_value = live_dash
+
+        exported = tmp_path / "dash.json"
+        export_to_json(live_data, str(exported))
+        result = runner.invoke(diff_cmd, ["-f", str(exported)])
+
+        assert result.exit_code == 0
+        assert "no differences" in result.output.lower()
+
     @patch("ddogctl.commands.apply.get_datadog_client")
     def test_diff_dashboard(self, mock_get_client, mock_client, runner):
         mock_get_client.return_value = mock_client
@@ -598,16 +622,12 @@ class TestDiffCommand:
 class TestApplyCliRegistration:
     """Tests that apply and diff are registered as top-level commands."""
 
-    def test_apply_registered_on_main(self, runner):
-        from ddogctl.cli import main
-
-        result = runner.invoke(main, ["apply", "--help"])
+    def test_apply_registered_on_main(self, runner, cli_main):
+        result = runner.invoke(cli_main, ["apply", "--help"])
         assert result.exit_code == 0
         assert "apply" in result.output.lower() or "--file" in result.output.lower()
 
-    def test_diff_registered_on_main(self, runner):
-        from ddogctl.cli import main
-
-        result = runner.invoke(main, ["diff", "--help"])
+    def test_diff_registered_on_main(self, runner, cli_main):
+        result = runner.invoke(cli_main, ["diff", "--help"])
         assert result.exit_code == 0
         assert "diff" in result.output.lower() or "--file" in result.output.lower()
@@ -3,9 +3,8 @@
 import json
 import pytest
 from unittest.mock import Mock, patch
-from click.testing import CliRunner
 from datadog_api_client.v1.model.monitor_overall_states import MonitorOverallStates
-from ddogctl.commands.monitor import monitor
+from ddogctl.commands.monitor import _build_monitor_list, _fetch_monitors, monitor
 
 
 class MockMonitor:
@@ -40,12 +39,6 @@ def mock_client():
     return client
 
 
-@pytest.fixture
-def runner():
-    """Click CLI test runner."""
-    return CliRunner()
-
-
 def test_monitor_list_state_filter(mock_client, runner):
     """Test that monitor list correctly filters by state.
 
@@ -63,41 +56,36 @@ def test_monitor_list_state_filter(mock_client, runner):
     # Mock the API response
     mock_client.monitors.list_monitors.return_value = mock_monitors
 
-    # Patch get_datadog_client to return our mock
-    with patch("ddogctl.commands.monitor.get_datadog_client", return_value=mock_client):
-        # Test filtering by Alert state only
-        result = runner.invoke(monitor, ["list", "--state", "Alert", "--format", "json"])
+    # Test filtering by Alert state only
+    output = _build_monitor_list(_fetch_monitors(mock_client, state=("Alert",)))
 
-        assert result.exit_code == 0, f"Command failed: {result.output}"
+    # Should only return Alert monitors (IDs 1 and 4)
+    assert len(output) == 2, f"Expected 2 Alert monitors, got {len(output)}"
+    assert output[0]["id"] == 1
+    assert output[1]["id"] == 4
 
-        # Parse JSON output
-        import json
+    # Test filtering by multiple states (Alert and Warn)
+    output = _build_monitor_list(_fetch_monitors(mock_client, state=("Alert", "Warn")))
 
-        output = json.loads(result.output)
+    # Should return Alert and Warn monitors (IDs 1, 2, 4)
+    assert len(output) == 3, f"Expected 3 Alert/Warn monitors, got {len(output)}"
+    monitor_ids = [m["id"] for m in output]
+    assert sorted(monitor_ids) == [1, 2, 4]
 
-        # Should only return Alert monitors (IDs 1 and 4)
-        assert len(output) == 2, f"Expected 2 Alert monitors, got {len(output)}"
-        assert output[0]["id"] == 1
-        assert output[1]["id"] == 4
+    # Verify OK monitor (ID 3) was filtered out
+    assert 3 not in monitor_ids, "OK monitor should be filtered out"
 
-        # Test filtering by multiple states (Alert and Warn)
+    # End to end through the --state Click option
+    with patch("ddogctl.commands.monitor.get_datadog_client", return_value=mock_client):
         result = runner.invoke(
             monitor, ["list", "--state", "Alert", "--state", "Warn", "--format", "json"]
         )
 
-        assert result.exit_code == 0, f"Command failed: {result.output}"
-        output = json.loads(result.output)
-
-        # Should return Alert and Warn monitors (IDs 1, 2, 4)
-        assert len(output) == 3, f"Expected 3 Alert/Warn monitors, got {len(output)}"
-        monitor_ids = [m["id"] for m in output]
-        assert sorted(monitor_ids) == [1, 2, 4]
-
-        # Verify OK monitor (ID 3) was filtered out
-        assert 3 not in monitor_ids, "OK monitor should be filtered out"
+    assert result.exit_code == 0
+    assert sorted(m["id"] for m in json.loads(result.output)) == [1, 2, 4]
 
 
-def test_monitor_list_no_state_filter(mock_client, runner):
+def test_monitor_list_no_state_filter(mock_client):
     """Test that monitor list without state filter returns all monitors."""
     mock_monitors = [
         MockMonitor(1, "Alert Monitor", MonitorOverallStates.ALERT),
@@ -106,17 +94,11 @@ def test_monitor_list_no_state_filter(mock_client, runner):
 
     mock_client.monitors.list_monitors.return_value = mock_monitors
 
-    with patch("ddogctl.commands.monitor.get_datadog_client", return_value=mock_client):
-        result = runner.invoke(monitor, ["list", "--format", "json"])
-
-        assert result.exit_code == 0
-
-        import json
-
-        output = json.loads(result.output)
+    output = _build_monitor_list(_fetch_monitors(mock_client))
 
-        # Should return all monitors
-        assert len(output) == 2
+    # Should return all monitors
+    assert len(output) == 2
+    mock_client.monitors.list_monitors.assert_called_once_with()
 
 
 # ============================================================================
@@ -124,67 +106,44 @@ def test_monitor_list_no_state_filter(mock_client, runner):
 # ============================================================================
 
 
-def test_monitor_list_table_format(mock_client, runner):
-    """Test monitor list with table format (default)."""
-    mock_monitors = [
+@pytest.fixture
+def mock_monitors():
+    """Monitors shared by the list output format tests."""
+    return [
         MockMonitor(
             1, "Test Monitor", MonitorOverallStates.ALERT, tags=["env:prod", "service:web"]
         ),
-    ]
-
-    mock_client.monitors.list_monitors.return_value = mock_monitors
-
-    with patch("ddogctl.commands.monitor.get_datadog_client", return_value=mock_client):
-        result = runner.invoke(monitor, ["list", "--format", "table"])
-
-        assert result.exit_code == 0
-        assert "Datadog Monitors" in result.output
-        assert "Test Monitor" in result.output
-        assert "Total monitors: 1" in result.output
-
-
-def test_monitor_list_markdown_format(mock_client, runner):
-    """Test monitor list with markdown format."""
-    mock_monitors = [
-        MockMonitor(1, "Test Monitor", MonitorOverallStates.ALERT),
         MockMonitor(2, "Another Monitor", MonitorOverallStates.OK),
     ]
 
-    mock_client.monitors.list_monitors.return_value = mock_monitors
-
-    with patch("ddogctl.commands.monitor.get_datadog_client", return_value=mock_client):
-        result = runner.invoke(monitor, ["list", "--format", "markdown"])
-
-        assert result.exit_code == 0
-        # Check markdown table structure
-        assert "| ID | State | Name |" in result.output
-        assert "|---|---|---|" in result.output
-        assert "| 1 |" in result.output
-        assert "| 2 |" in result.output
-        assert "Test Monitor" in result.output
-
-
-def test_monitor_list_json_format(mock_client, runner):
-    """Test monitor list with JSON format."""
-    mock_monitors = [
-        MockMonitor(1, "Test Monitor", MonitorOverallStates.ALERT, tags=["env:prod"]),
-    ]
 
+@pytest.mark.parametrize(
+    "fmt,expected",
+    [
+        ("table", ["Datadog Monitors", "Test Monitor", "Total monitors: 2"]),
+        ("markdown", ["| ID | State | Name |", "|---|---|---|", "| 1 |", "| 2 |", "Test Monitor"]),
+        ("json", None),
+    ],
+)
+def test_monitor_list_formats(mock_client, runner, mock_monitors, fmt, expected):
+    """Test monitor list with table, markdown, and JSON formats."""
     mock_client.monitors.list_monitors.return_value = mock_monitors
 
     with patch("ddogctl.commands.monitor.get_datadog_client", return_value=mock_client):
-        result = runner.invoke(monitor, ["list", "--format", "json"])
-
-        assert result.exit_code == 0
+        result = runner.invoke(monitor, ["list", "--format", fmt])
 
-        import json
+    assert result.exit_code == 0
 
+    if fmt == "json":
         output = json.loads(result.output)
 
-        assert len(output) == 1
+        assert len(output) == 2
         assert output[0]["id"] == 1
         assert output[0]["name"] == "Test Monitor"
-        assert output[0]["tags"] == ["env:prod"]
+        assert output[0]["tags"] == ["env:prod", "service:web"]
+    else:
+        for text in expected:
+            assert text in result.output
 
 
 # ============================================================================
@@ -225,8 +184,6 @@ def test_monitor_get_json_format(mock_client, runner):
 
         assert result.exit_code == 0
 
-        import json
-
         output = json.loads(result.output)
 
         assert output["id"] == 456
@@ -414,8 +371,6 @@ def test_monitor_workflow_list_get(mock_client, runner):
         result = runner.invoke(monitor, ["list", "--format", "json"])
         assert result.exit_code == 0
 
-        import json
-
         monitors_list = json.loads(result.output)
         assert len(monitors_list) == 2
 
@@ -1,282 +1,188 @@
 """Tests for RUM commands."""
 
 import json
+import pytest
 from datetime import datetime
-from unittest.mock import Mock, patch
-from tests.conftest import create_mock_rum_event
+from types import SimpleNamespace as NS
+from ddogctl.commands.rum import rum
+from tests.conftest import assert_all_in, create_mock_rum_event
 
-# Events command tests
+_NOW = datetime(2025, 1, 15, 12, 0, 0)
 
 
-def test_rum_events_table(mock_client, runner):
-    """Test events table output has correct headers and content."""
-    from ddogctl.commands.rum import rum
+class MockBucket:
+    """RUM aggregate bucket with ``by`` and ``computes`` mappings."""
 
-    now = datetime.now()
-    mock_events = [
-        create_mock_rum_event("evt-001", "view", now, {"url": "/home"}),
-        create_mock_rum_event("evt-002", "action", now, {"name": "click"}),
-    ]
-    mock_response = Mock(data=mock_events)
-    mock_client.rum.list_rum_events.return_value = mock_response
+    __slots__ = ("by", "computes")
 
-    with patch("ddogctl.commands.rum.get_datadog_client", return_value=mock_client):
-        result = runner.invoke(rum, ["events"])
+    def __init__(self, by, computes):
+        self.by = by
+        self.computes = computes
 
-        assert result.exit_code == 0
-        assert "RUM Events" in result.output
-        assert "Time" in result.output
-        assert "Type" in result.output
-        assert "ID" in result.output
-        assert "Total events: 2" in result.output
 
+# Events command tests
 
-def test_rum_events_json(mock_client, runner):
-    """Test events JSON output has expected fields."""
-    from ddogctl.commands.rum import rum
 
-    now = datetime.now()
+def test_rum_events_table(mock_client, runner, patched_rum_client):
+    """Test events table output has correct headers and content."""
     mock_events = [
-        create_mock_rum_event("evt-001", "view", now, {"url": "/home"}),
+        create_mock_rum_event("evt-001", "view", _NOW, {"url": "/home"}),
+        create_mock_rum_event("evt-002", "action", _NOW, {"name": "click"}),
     ]
-    mock_response = Mock(data=mock_events)
-    mock_client.rum.list_rum_events.return_value = mock_response
-
-    with patch("ddogctl.commands.rum.get_datadog_client", return_value=mock_client):
-        result = runner.invoke(rum, ["events", "--format", "json"])
-
-        assert result.exit_code == 0
-        output = json.loads(result.output)
-        assert len(output) == 1
-        assert output[0]["id"] == "evt-001"
-        assert output[0]["type"] == "view"
-        assert "timestamp" in output[0]
-        assert "attributes" in output[0]
-
-
-def test_rum_events_empty(mock_client, runner):
-    """Test events with no results shows total 0."""
-    from ddogctl.commands.rum import rum
-
-    mock_response = Mock(data=[])
+    mock_response = NS(data=mock_events)
     mock_client.rum.list_rum_events.return_value = mock_response
 
-    with patch("ddogctl.commands.rum.get_datadog_client", return_value=mock_client):
-        result = runner.invoke(rum, ["events"])
-
-        assert result.exit_code == 0
-        assert "Total events: 0" in result.output
+    result = runner.invoke(rum, ["events"])
 
+    assert result.exit_code == 0
+    assert_all_in(result.output, "RUM Events", "Time", "Type", "ID", "Total events: 2")
 
-def test_rum_events_with_query(mock_client, runner):
-    """Test events with --query passes query to API."""
-    from ddogctl.commands.rum import rum
 
-    mock_response = Mock(data=[])
+def test_rum_events_json(mock_client, runner, patched_rum_client):
+    """Test events JSON output has expected fields."""
+    mock_events = [
+        create_mock_rum_event("evt-001", "view", _NOW, {"url": "/home"}),
+    ]
+    mock_response = NS(data=mock_events)
     mock_client.rum.list_rum_events.return_value = mock_response
 
-    with patch("ddogctl.commands.rum.get_datadog_client", return_value=mock_client):
-        result = runner.invoke(rum, ["events", "--query", "@type:error"])
+    result = runner.invoke(rum, ["events", "--format", "json"])
 
-        assert result.exit_code == 0
-        call_kwargs = mock_client.rum.list_rum_events.call_args.kwargs
-        assert call_kwargs["filter_query"] == "@type:error"
+    assert result.exit_code == 0
+    output = json.loads(result.output)
+    assert len(output) == 1
+    assert output[0]["id"] == "evt-001"
+    assert output[0]["type"] == "view"
+    assert "timestamp" in output[0]
+    assert "attributes" in output[0]
 
 
-def test_rum_events_with_time_range(mock_client, runner):
-    """Test events with --from 24h is accepted."""
-    from ddogctl.commands.rum import rum
-
-    mock_response = Mock(data=[])
+def test_rum_events_empty(mock_client, runner, patched_rum_client):
+    """Test events with no results shows total 0."""
+    mock_response = NS(data=[])
     mock_client.rum.list_rum_events.return_value = mock_response
 
-    with patch("ddogctl.commands.rum.get_datadog_client", return_value=mock_client):
-        result = runner.invoke(rum, ["events", "--from", "24h"])
-
-        assert result.exit_code == 0
-        mock_client.rum.list_rum_events.assert_called_once()
-
-
-def test_rum_events_with_limit(mock_client, runner):
-    """Test events respects --limit parameter."""
-    from ddogctl.commands.rum import rum
-
-    mock_response = Mock(data=[])
+    result = runner.invoke(rum, ["events"])
+
+    assert result.exit_code == 0
+    assert "Total events: 0" in result.output
+
+
+@pytest.mark.parametrize(
+    "cli_args,expected_kwarg,expected_val",
+    [
+        (["--query", "@type:error"], "filter_query", "@type:error"),
+        (["--limit", "10"], "page_limit", 10),
+        (["--from", "24h"], None, None),
+    ],
+)
+def test_rum_events_params(
+    mock_client, runner, patched_rum_client, cli_args, expected_kwarg, expected_val
+):
+    """Test events options are accepted and passed through to the API."""
+    mock_response = NS(data=[])
     mock_client.rum.list_rum_events.return_value = mock_response
 
-    with patch("ddogctl.commands.rum.get_datadog_client", return_value=mock_client):
-        result = runner.invoke(rum, ["events", "--limit", "10"])
+    result = runner.invoke(rum, ["events", *cli_args])
 
-        assert result.exit_code == 0
+    assert result.exit_code == 0
+    mock_client.rum.list_rum_events.assert_called_once()
+    if expected_kwarg:
         call_kwargs = mock_client.rum.list_rum_events.call_args.kwargs
-        assert call_kwargs["page_limit"] == 10
+        assert call_kwargs[expected_kwarg] == expected_val
 
 
 # Analytics command tests
 
 
-def test_rum_analytics_table(mock_client, runner):
+def test_rum_analytics_table(mock_client, runner, patched_rum_client):
     """Test analytics table output has correct columns."""
-    from ddogctl.commands.rum import rum
-
-    class MockBucket:
-        def __init__(self, event_type, count):
-            self.by = {"@type": event_type}
-            self.computes = {"c0": count}
-
     mock_buckets = [
-        MockBucket("view", 1500),
-        MockBucket("action", 800),
+        MockBucket(by={"@type": "view"}, computes={"c0": 1500}),
+        MockBucket(by={"@type": "action"}, computes={"c0": 800}),
     ]
-    mock_response = Mock(data=Mock(buckets=mock_buckets))
+    mock_response = NS(data=NS(buckets=mock_buckets))
     mock_client.rum.aggregate_rum_events.return_value = mock_response
 
-    with patch("ddogctl.commands.rum.get_datadog_client", return_value=mock_client):
-        result = runner.invoke(rum, ["analytics", "--metric", "count", "--group-by", "@type"])
+    result = runner.invoke(rum, ["analytics", "--metric", "count", "--group-by", "@type"])
 
-        assert result.exit_code == 0
-        assert "RUM Analytics" in result.output
-        assert "COUNT" in result.output
-        assert "type" in result.output
-        assert "view" in result.output
-        assert "1500" in result.output
-        assert "Total groups: 2" in result.output
+    assert result.exit_code == 0
+    assert_all_in(
+        result.output, "RUM Analytics", "COUNT", "type", "view", "1500", "Total groups: 2"
+    )
 
 
-def test_rum_analytics_json(mock_client, runner):
+def test_rum_analytics_json(mock_client, runner, patched_rum_client):
     """Test analytics JSON output has expected structure."""
-    from ddogctl.commands.rum import rum
-
-    class MockBucket:
-        def __init__(self, event_type, count):
-            self.by = {"@type": event_type}
-            self.computes = {"c0": count}
-
     mock_buckets = [
-        MockBucket("view", 1500),
-        MockBucket("action", 800),
+        MockBucket(by={"@type": "view"}, computes={"c0": 1500}),
+        MockBucket(by={"@type": "action"}, computes={"c0": 800}),
     ]
-    mock_response = Mock(data=Mock(buckets=mock_buckets))
+    mock_response = NS(data=NS(buckets=mock_buckets))
     mock_client.rum.aggregate_rum_events.return_value = mock_response
 
-    with patch("ddogctl.commands.rum.get_datadog_client", return_value=mock_client):
-        result = runner.invoke(
-            rum,
-            ["analytics", "--metric", "count", "--group-by", "@type", "--format", "json"],
-        )
-
-        assert result.exit_code == 0
-        output = json.loads(result.output)
-        assert len(output) == 2
-        assert output[0]["@type"] == "view"
-        assert output[0]["count"] == 1500
-        assert output[1]["@type"] == "action"
-        assert output[1]["count"] == 800
-
-
-def test_rum_analytics_p99(mock_client, runner):
-    """Test analytics with p99 metric converts ns to ms."""
-    from ddogctl.commands.rum import rum
-
-    class MockBucket:
-        def __init__(self, url, p99_ns):
-            self.by = {"@view.url": url}
-            self.computes = {"c0": p99_ns}
-
-    mock_buckets = [
-        MockBucket("/home", 2_500_000_000),  # 2500ms
-    ]
-    mock_response = Mock(data=Mock(buckets=mock_buckets))
+    result = runner.invoke(
+        rum,
+        ["analytics", "--metric", "count", "--group-by", "@type", "--format", "json"],
+    )
+
+    assert result.exit_code == 0
+    output = json.loads(result.output)
+    assert len(output) == 2
+    assert output[0]["@type"] == "view"
+    assert output[0]["count"] == 1500
+    assert output[1]["@type"] == "action"
+    assert output[1]["count"] == 800
+
+
+@pytest.mark.parametrize(
+    "metric,by_key,by_val,raw_val,expected",
+    [
+        ("count", "@type", "view", 1500, 1500),
+        ("p99", "@view.url", "/home", 2_500_000_000, 2500.0),  # ns -> ms
+        ("avg", "@geo.country", "US", 500_000_000, 500.0),  # ns -> ms
+    ],
+)
+def test_rum_analytics_metrics(
+    mock_client, runner, patched_rum_client, metric, by_key, by_val, raw_val, expected
+):
+    """Test analytics JSON values per metric; time metrics are converted from ns to ms."""
+    mock_buckets = [MockBucket(by={by_key: by_val}, computes={"c0": raw_val})]
+    mock_response = NS(data=NS(buckets=mock_buckets))
     mock_client.rum.aggregate_rum_events.return_value = mock_response
 
-    with patch("ddogctl.commands.rum.get_datadog_client", return_value=mock_client):
-        result = runner.invoke(
-            rum,
-            [
-                "analytics",
-                "--metric",
-                "p99",
-                "--group-by",
-                "@view.url",
-                "--format",
-                "json",
-            ],
-        )
-
-        assert result.exit_code == 0
-        output = json.loads(result.output)
-        assert len(output) == 1
-        assert output[0]["p99"] == 2500.0
-
-
-def test_rum_analytics_avg(mock_client, runner):
-    """Test analytics with avg metric converts ns to ms."""
-    from ddogctl.commands.rum import rum
-
-    class MockBucket:
-        def __init__(self, country, avg_ns):
-            self.by = {"@geo.country": country}
-            self.computes = {"c0": avg_ns}
+    result = runner.invoke(
+        rum,
+        ["analytics", "--metric", metric, "--group-by", by_key, "--format", "json"],
+    )
 
-    mock_buckets = [
-        MockBucket("US", 500_000_000),  # 500ms
-        MockBucket("EU", 800_000_000),  # 800ms
-    ]
-    mock_response = Mock(data=Mock(buckets=mock_buckets))
-    mock_client.rum.aggregate_rum_events.return_value = mock_response
-
-    with patch("ddogctl.commands.rum.get_datadog_client", return_value=mock_client):
-        result = runner.invoke(
-            rum,
-            [
-                "analytics",
-                "--metric",
-                "avg",
-                "--group-by",
-                "@geo.country",
-                "--format",
-                "json",
-            ],
-        )
-
-        assert result.exit_code == 0
-        output = json.loads(result.output)
-        assert len(output) == 2
-        assert output[0]["avg"] == 500.0
-        assert output[1]["avg"] == 800.0
-
-
-def test_rum_analytics_without_groupby(mock_client, runner):
-    """Test analytics without group-by returns single aggregate."""
-    from ddogctl.commands.rum import rum
+    assert result.exit_code == 0
+    output = json.loads(result.output)
+    assert len(output) == 1
+    assert output[0][by_key] == by_val
+    assert output[0][metric] == expected
 
-    class MockBucket:
-        def __init__(self, count):
-            self.by = {}
-            self.computes = {"c0": count}
 
-    mock_buckets = [MockBucket(12345)]
-    mock_response = Mock(data=Mock(buckets=mock_buckets))
+def test_rum_analytics_without_groupby(mock_client, runner, patched_rum_client):
+    """Test analytics without group-by returns single aggregate."""
+    mock_buckets = [MockBucket(by={}, computes={"c0": 12345})]
+    mock_response = NS(data=NS(buckets=mock_buckets))
     mock_client.rum.aggregate_rum_events.return_value = mock_response
 
-    with patch("ddogctl.commands.rum.get_datadog_client", return_value=mock_client):
-        result = runner.invoke(rum, ["analytics", "--metric", "count", "--format", "json"])
+    result = runner.invoke(rum, ["analytics", "--metric", "count", "--format", "json"])
 
-        assert result.exit_code == 0
-        output = json.loads(result.output)
-        assert len(output) == 1
-        assert output[0]["count"] == 12345
+    assert result.exit_code == 0
+    output = json.loads(result.output)
+    assert len(output) == 1
+    assert output[0]["count"] == 12345
 
 
-def test_rum_analytics_empty(mock_client, runner):
+def test_rum_analytics_empty(mock_client, runner, patched_rum_client):
     """Test analytics with no results shows total 0."""
-    from ddogctl.commands.rum import rum
-
-    mock_response = Mock(data=Mock(buckets=[]))
+    mock_response = NS(data=NS(buckets=[]))
     mock_client.rum.aggregate_rum_events.return_value = mock_response
 
-    with patch("ddogctl.commands.rum.get_datadog_client", return_value=mock_client):
-        result = runner.invoke(rum, ["analytics", "--metric", "count"])
+    result = runner.invoke(rum, ["analytics", "--metric", "count"])
 
-        assert result.exit_code == 0
-        assert "Total groups: 0" in result.output
+    assert result.exit_code == 0
+    assert "Total groups: 0" in result.output
@@ -1,298 +1,152 @@
 """Tests for tag management commands."""
 
-import json
-from unittest.mock import Mock, patch
-
-
-def test_tag_list_table_format(mock_client, runner):
-    """Test listing tags for a host in table format."""
-    from ddogctl.commands.tag import tag
-
-    mock_response = Mock()
-    mock_response.host = "web-prod-01"
-    mock_response.tags = ["env:prod", "service:web", "team:platform"]
-    mock_client.tags.get_host_tags.return_value = mock_response
-
-    with patch("ddogctl.commands.tag.get_datadog_client", return_value=mock_client):
-        result = runner.invoke(tag, ["list", "web-prod-01"])
+from types import SimpleNamespace as NS
+
+import pytest
+
+from ddogctl.commands.tag import tag
+from tests.conftest import assert_json_contains
+
+# Every test talks to mock_client through the patched get_datadog_client
+pytestmark = pytest.mark.usefixtures("patched_tag_client")
+
+
+@pytest.fixture
+def tag_list_response(mock_client):
+    """Set the get_host_tags response; ``tags=None`` omits the tags attribute."""
+
+    def _set(host, tags):
+        if tags is None:
+            response = NS(host=host)
+        else:
+            response = NS(host=host, tags=tags)
+        mock_client.tags.get_host_tags.return_value = response
+
+    return _set
+
+
+@pytest.mark.parametrize(
+    "args,tags,expected_substrings,call_kwargs",
+    [
+        (
+            [],
+            ["env:prod", "service:web", "team:platform"],
+            ["web-prod-01", "env:prod", "service:web", "team:platform", "Total tags: 3"],
+            {"host_name": "web-prod-01"},
+        ),
+        (
+            ["--source", "users"],
+            ["env:prod"],
+            ["env:prod"],
+            {"host_name": "web-prod-01", "source": "users"},
+        ),
+        ([], [], ["No tags"], {"host_name": "web-prod-01"}),
+        # tags=None: the response has no tags attribute at all
+        ([], None, ["No tags"], {"host_name": "web-prod-01"}),
+    ],
+    ids=["table", "with_source", "empty_tags", "no_tags_attribute"],
+)
+def test_tag_list(
+    mock_client, runner, tag_list_response, args, tags, expected_substrings, call_kwargs
+):
+    """Test tag list table output and the kwargs passed to the API."""
+    tag_list_response("web-prod-01", tags)
+
+    result = runner.invoke(
+        tag, ["list", "web-prod-01", *args], standalone_mode=False, catch_exceptions=False
+    )
 
     assert result.exit_code == 0
-    assert "web-prod-01" in result.output
-    assert "env:prod" in result.output
-    assert "service:web" in result.output
-    assert "team:platform" in result.output
+    for text in expected_substrings:
+        assert text in result.output
+    mock_client.tags.get_host_tags.assert_called_once_with(**call_kwargs)
 
 
-def test_tag_list_json_format(mock_client, runner):
+def test_tag_list_json_format(runner, tag_list_response):
     """Test listing tags for a host in JSON format."""
-    from ddogctl.commands.tag import tag
-
-    mock_response = Mock()
-    mock_response.host = "web-prod-01"
-    mock_response.tags = ["env:prod", "service:web"]
-    mock_client.tags.get_host_tags.return_value = mock_response
-
-    with patch("ddogctl.commands.tag.get_datadog_client", return_value=mock_client):
-        result = runner.invoke(tag, ["list", "web-prod-01", "--format", "json"])
-
-    assert result.exit_code == 0
-    output = json.loads(result.output)
-    assert output["host"] == "web-prod-01"
-    assert "env:prod" in output["tags"]
-    assert "service:web" in output["tags"]
-
-
-def test_tag_list_with_source(mock_client, runner):
-    """Test listing tags filtered by source."""
-    from ddogctl.commands.tag import tag
-
-    mock_response = Mock()
-    mock_response.host = "web-prod-01"
-    mock_response.tags = ["env:prod"]
-    mock_client.tags.get_host_tags.return_value = mock_response
-
-    with patch("ddogctl.commands.tag.get_datadog_client", return_value=mock_client):
-        result = runner.invoke(tag, ["list", "web-prod-01", "--source", "users"])
-
-    assert result.exit_code == 0
-    mock_client.tags.get_host_tags.assert_called_once_with(host_name="web-prod-01", source="users")
-
-
-def test_tag_list_without_source(mock_client, runner):
-    """Test listing tags without source does not pass source kwarg."""
-    from ddogctl.commands.tag import tag
-
-    mock_response = Mock()
-    mock_response.host = "web-prod-01"
-    mock_response.tags = ["env:prod"]
-    mock_client.tags.get_host_tags.return_value = mock_response
-
-    with patch("ddogctl.commands.tag.get_datadog_client", return_value=mock_client):
-        result = runner.invoke(tag, ["list", "web-prod-01"])
-
-    assert result.exit_code == 0
-    mock_client.tags.get_host_tags.assert_called_once_with(host_name="web-prod-01")
-
+    tag_list_response("web-prod-01", ["env:prod", "service:web"])
 
-def test_tag_list_empty_tags(mock_client, runner):
-    """Test listing tags when host has no tags."""
-    from ddogctl.commands.tag import tag
-
-    mock_response = Mock()
-    mock_response.host = "web-prod-01"
-    mock_response.tags = []
-    mock_client.tags.get_host_tags.return_value = mock_response
-
-    with patch("ddogctl.commands.tag.get_datadog_client", return_value=mock_client):
-        result = runner.invoke(tag, ["list", "web-prod-01"])
-
-    assert result.exit_code == 0
-    assert "No tags" in result.output
-
-
-def test_tag_list_no_tags_attribute(mock_client, runner):
-    """Test listing tags when response has no tags attribute (unset)."""
-    from ddogctl.commands.tag import tag
-
-    mock_response = Mock(spec=[])
-    mock_response.host = "web-prod-01"
-    # Simulate tags being unset by making hasattr return False
-    mock_client.tags.get_host_tags.return_value = mock_response
-
-    with patch("ddogctl.commands.tag.get_datadog_client", return_value=mock_client):
-        result = runner.invoke(tag, ["list", "web-prod-01"])
-
-    assert result.exit_code == 0
-    assert "No tags" in result.output
-
-
-def test_tag_add_single_tag(mock_client, runner):
-    """Test adding a single tag to a host."""
-    from ddogctl.commands.tag import tag
-
-    mock_response = Mock()
-    mock_response.host = "web-prod-01"
-    mock_response.tags = ["env:prod"]
-    mock_client.tags.create_host_tags.return_value = mock_response
-
-    with patch("ddogctl.commands.tag.get_datadog_client", return_value=mock_client):
-        result = runner.invoke(tag, ["add", "web-prod-01", "env:prod"])
-
-    assert result.exit_code == 0
-    assert "Added" in result.output or "added" in result.output
-    mock_client.tags.create_host_tags.assert_called_once()
-    call_kwargs = mock_client.tags.create_host_tags.call_args
-    assert call_kwargs.kwargs["host_name"] == "web-prod-01"
-    body = call_kwargs.kwargs["body"]
-    assert body.tags == ["env:prod"]
-
-
-def test_tag_add_multiple_tags(mock_client, runner):
-    """Test adding multiple tags to a host."""
-    from ddogctl.commands.tag import tag
-
-    mock_response = Mock()
-    mock_response.host = "web-prod-01"
-    mock_response.tags = ["env:prod", "service:web", "team:platform"]
-    mock_client.tags.create_host_tags.return_value = mock_response
-
-    with patch("ddogctl.commands.tag.get_datadog_client", return_value=mock_client):
-        result = runner.invoke(
-            tag, ["add", "web-prod-01", "env:prod", "service:web", "team:platform"]
-        )
-
-    assert result.exit_code == 0
-    call_kwargs = mock_client.tags.create_host_tags.call_args
-    body = call_kwargs.kwargs["body"]
-    assert sorted(body.tags) == sorted(["env:prod", "service:web", "team:platform"])
-
-
-def test_tag_add_with_source(mock_client, runner):
-    """Test adding tags with a specific source."""
-    from ddogctl.commands.tag import tag
-
-    mock_response = Mock()
-    mock_response.host = "web-prod-01"
-    mock_response.tags = ["env:prod"]
-    mock_client.tags.create_host_tags.return_value = mock_response
-
-    with patch("ddogctl.commands.tag.get_datadog_client", return_value=mock_client):
-        result = runner.invoke(tag, ["add", "web-prod-01", "env:prod", "--source", "chef"])
-
-    assert result.exit_code == 0
-    call_kwargs = mock_client.tags.create_host_tags.call_args
-    assert call_kwargs.kwargs["source"] == "chef"
-
-
-def test_tag_add_without_source(mock_client, runner):
-    """Test adding tags without source does not pass source kwarg."""
-    from ddogctl.commands.tag import tag
-
-    mock_response = Mock()
-    mock_response.host = "web-prod-01"
-    mock_response.tags = ["env:prod"]
-    mock_client.tags.create_host_tags.return_value = mock_response
-
-    with patch("ddogctl.commands.tag.get_datadog_client", return_value=mock_client):
-        result = runner.invoke(tag, ["add", "web-prod-01", "env:prod"])
-
-    assert result.exit_code == 0
-    call_kwargs = mock_client.tags.create_host_tags.call_args
-    assert "source" not in call_kwargs.kwargs
-
-
-def test_tag_replace_tags(mock_client, runner):
-    """Test replacing all tags on a host."""
-    from ddogctl.commands.tag import tag
-
-    mock_response = Mock()
-    mock_response.host = "web-prod-01"
-    mock_response.tags = ["env:staging"]
-    mock_client.tags.update_host_tags.return_value = mock_response
-
-    with patch("ddogctl.commands.tag.get_datadog_client", return_value=mock_client):
-        result = runner.invoke(tag, ["replace", "web-prod-01", "env:staging"])
-
-    assert result.exit_code == 0
-    assert "Replaced" in result.output or "replaced" in result.output
-    mock_client.tags.update_host_tags.assert_called_once()
-    call_kwargs = mock_client.tags.update_host_tags.call_args
-    assert call_kwargs.kwargs["host_name"] == "web-prod-01"
-    body = call_kwargs.kwargs["body"]
-    assert body.tags == ["env:staging"]
-
-
-def test_tag_replace_multiple_tags(mock_client, runner):
-    """Test replacing tags with multiple new tags."""
-    from ddogctl.commands.tag import tag
-
-    mock_response = Mock()
-    mock_response.host = "web-prod-01"
-    mock_response.tags = ["env:staging", "service:api"]
-    mock_client.tags.update_host_tags.return_value = mock_response
-
-    with patch("ddogctl.commands.tag.get_datadog_client", return_value=mock_client):
-        result = runner.invoke(tag, ["replace", "web-prod-01", "env:staging", "service:api"])
+    result = runner.invoke(
+        tag,
+        ["list", "web-prod-01", "--format", "json"],
+        standalone_mode=False,
+        catch_exceptions=False,
+    )
 
     assert result.exit_code == 0
-    call_kwargs = mock_client.tags.update_host_tags.call_args
-    body = call_kwargs.kwargs["body"]
-    assert sorted(body.tags) == sorted(["env:staging", "service:api"])
-
-
-def test_tag_replace_with_source(mock_client, runner):
-    """Test replacing tags with a specific source."""
-    from ddogctl.commands.tag import tag
-
-    mock_response = Mock()
-    mock_response.host = "web-prod-01"
-    mock_response.tags = ["env:staging"]
-    mock_client.tags.update_host_tags.return_value = mock_response
+    assert_json_contains(
+        result.output, {"host": "web-prod-01", "tags": ["env:prod", "service:web"]}
+    )
 
-    with patch("ddogctl.commands.tag.get_datadog_client", return_value=mock_client):
-        result = runner.invoke(tag, ["replace", "web-prod-01", "env:staging", "--source", "puppet"])
 
-    assert result.exit_code == 0
-    call_kwargs = mock_client.tags.update_host_tags.call_args
-    assert call_kwargs.kwargs["source"] == "puppet"
+@pytest.mark.parametrize(
+    "subcommand,api_method,message,tags,source",
+    [
+        ("add", "create_host_tags", "Added", ["env:prod"], None),
+        ("add", "create_host_tags", "Added", ["env:prod", "service:web", "team:platform"], None),
+        ("add", "create_host_tags", "Added", ["env:prod"], "chef"),
+        ("replace", "update_host_tags", "Replaced", ["env:staging"], None),
+        ("replace", "update_host_tags", "Replaced", ["env:staging", "service:api"], None),
+        ("replace", "update_host_tags", "Replaced", ["env:staging"], "puppet"),
+    ],
+    ids=[
+        "add_single",
+        "add_multiple",
+        "add_with_source",
+        "replace_single",
+        "replace_multiple",
+        "replace_with_source",
+    ],
+)
+def test_tag_mutation(mock_client, runner, subcommand, api_method, message, tags, source):
+    """Test add/replace send the tags in a HostTags body, with source only when given."""
+    api = getattr(mock_client.tags, api_method)
+    api.return_value = NS(host="web-prod-01", tags=tags)
+
+    args = [subcommand, "web-prod-01", *tags]
+    if source:
+        args += ["--source", source]
+    result = runner.invoke(tag, args, standalone_mode=False, catch_exceptions=False)
+
+    assert result.exit_code == 0
+    assert message in result.output
+    api.assert_called_once()
+    call_kwargs = api.call_args.kwargs
+    assert call_kwargs["host_name"] == "web-prod-01"
+    assert sorted(call_kwargs["body"].tags) == sorted(tags)
+    if source:
+        assert call_kwargs["source"] == source
+    else:
+        assert "source" not in call_kwargs
 
 
 def test_tag_detach(mock_client, runner):
     """Test detaching (removing) all tags from a host."""
-    from ddogctl.commands.tag import tag
-
     mock_client.tags.delete_host_tags.return_value = None
 
-    with patch("ddogctl.commands.tag.get_datadog_client", return_value=mock_client):
-        result = runner.invoke(tag, ["detach", "web-prod-01"])
+    result = runner.invoke(
+        tag, ["detach", "web-prod-01"], standalone_mode=False, catch_exceptions=False
+    )
 
     assert result.exit_code == 0
     assert "Detached" in result.output or "detached" in result.output or "Removed" in result.output
     mock_client.tags.delete_host_tags.assert_called_once_with(host_name="web-prod-01")
 
 
-def test_tag_detach_with_source(mock_client, runner):
+def test_tag_detach_with_source(mock_client):
     """Test detaching tags with a specific source."""
-    from ddogctl.commands.tag import tag
-
     mock_client.tags.delete_host_tags.return_value = None
 
-    with patch("ddogctl.commands.tag.get_datadog_client", return_value=mock_client):
-        result = runner.invoke(tag, ["detach", "web-prod-01", "--source", "users"])
+    # Only the API call is checked, so call the command callback without CliRunner
+    tag.commands["detach"].callback(host="web-prod-01", source="users")
 
-    assert result.exit_code == 0
     mock_client.tags.delete_host_tags.assert_called_once_with(
         host_name="web-prod-01", source="users"
     )
 
 
-def test_tag_add_requires_tags_argument(runner):
-    """Test that add command requires at least one tag."""
-    from ddogctl.commands.tag import tag
-
-    result = runner.invoke(tag, ["add", "web-prod-01"])
+@pytest.mark.parametrize("subcommand", ["add", "replace"])
+def test_tag_mutation_requires_tags_argument(runner, subcommand):
+    """Test that add and replace require at least one tag."""
+    result = runner.invoke(tag, [subcommand, "web-prod-01"])
     assert result.exit_code != 0
-
-
-def test_tag_replace_requires_tags_argument(runner):
-    """Test that replace command requires at least one tag."""
-    from ddogctl.commands.tag import tag
-
-    result = runner.invoke(tag, ["replace", "web-prod-01"])
-    assert result.exit_code != 0
-
-
-def test_tag_list_table_shows_total(mock_client, runner):
-    """Test that table output shows tag count."""
-    from ddogctl.commands.tag import tag
-
-    mock_response = Mock()
-    mock_response.host = "web-prod-01"
-    mock_response.tags = ["env:prod", "service:web", "team:platform"]
-    mock_client.tags.get_host_tags.return_value = mock_response
-
-    with patch("ddogctl.commands.tag.get_datadog_client", return_value=mock_client):
-        result = runner.invoke(tag, ["list", "web-prod-01"])
-
-    assert result.exit_code == 0
-    assert "3" in result.output
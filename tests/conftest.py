@@ -1,23 +1,28 @@
 """Shared test fixtures and utilities."""
 
+import functools
+import itertools
+import json
+import os
 import pytest
+from datetime import datetime, timedelta
+from types import SimpleNamespace
 from unittest.mock import Mock
 from click.testing import CliRunner
 
+import ddogctl.commands.notebook as _nb_mod
+import ddogctl.commands.rum as _rum_mod
+import ddogctl.commands.tag as _tag_mod
+import ddogctl.commands.user as _user_mod
+from ddogctl.config import DatadogConfig
 
-@pytest.fixture
-def mock_client():
-    """Create a mock Datadog client with common attributes.
 
-    This fixture provides a base mock client that can be used across all test modules.
-    Individual tests should configure specific API methods (monitors, hosts, metrics, etc.)
-    as needed.
+@pytest.fixture(scope="session")
+def _mock_client_proto():
+    """Mock client skeleton built once per session.
 
-    Example:
-        def test_something(mock_client):
-            mock_client.monitors.list_monitors.return_value = [...]
-            with patch('ddogctl.commands.monitor.get_datadog_client', return_value=mock_client):
-                # test code
+    Building a tree of ``Mock`` objects is far more expensive than resetting one, so
+    ``mock_client`` hands out this prototype after clearing it for each test.
     """
     client = Mock()
     client.monitors = Mock()
@@ -40,14 +45,64 @@ def mock_client():
     client.ci_pipelines = Mock()
     client.ci_tests = Mock()
     client.notebooks = Mock()
+    client.tags = Mock()
     return client
 
 
 @pytest.fixture
+def mock_client(_mock_client_proto):
+    """Create a mock Datadog client with common attributes.
+
+    This fixture provides a base mock client that can be used across all test modules.
+    Individual tests should configure specific API methods (monitors, hosts, metrics, etc.)
+    as needed. The underlying mock is shared for the session and reset before each test,
+    so calls, return values and side effects never leak between tests.
+
+    Example:
+        def test_something(mock_client):
+            mock_client.monitors.list_monitors.return_value = [...]
+            with patch('ddogctl.commands.monitor.get_datadog_client', return_value=mock_client):
+                # test code
+    """
+    _mock_client_proto.reset_mock(return_value=True, side_effect=True)
+    return _mock_client_proto
+
+
+@pytest.fixture
+def patched_nb_client(monkeypatch, mock_client):
+    """Route ``ddogctl.commands.notebook.get_datadog_client`` to ``mock_client``."""
+    monkeypatch.setattr(_nb_mod, "get_datadog_client", lambda *args, **kwargs: mock_client)
+    return mock_client
+
+
+@pytest.fixture
+def patched_rum_client(monkeypatch, mock_client):
+    """Route ``ddogctl.commands.rum.get_datadog_client`` to ``mock_client``."""
+    monkeypatch.setattr(_rum_mod, "get_datadog_client", lambda *args, **kwargs: mock_client)
+    return mock_client
+
+
+@pytest.fixture
+def patched_tag_client(monkeypatch, mock_client):
+    """Route ``ddogctl.commands.tag.get_datadog_client`` to ``mock_client``."""
+    monkeypatch.setattr(_tag_mod, "get_datadog_client", lambda *args, **kwargs: mock_client)
+    return mock_client
+
+
+@pytest.fixture
+def patched_user_client(monkeypatch, mock_client):
+    """Route ``ddogctl.commands.user.get_datadog_client`` to ``mock_client``."""
+    monkeypatch.setattr(_user_mod, "get_datadog_client", lambda *args, **kwargs: mock_client)
+    return mock_client
+
+
+@pytest.fixture(scope="session")
 def runner():
     """Click CLI test runner.
 
-    Use this fixture to invoke Click commands in tests.
+    Use this fixture to invoke Click commands in tests. Session-scoped, so there is one
+    runner per session (one per worker under ``pytest -n auto``): ``CliRunner`` keeps no
+    state between ``invoke`` calls, each of which gets its own output buffers.
 
     Example:
         def test_command(runner):
@@ -57,7 +112,108 @@ def runner():
     return CliRunner()
 
 
+@pytest.fixture
+def clean_dd_env(monkeypatch):
+    """Remove ``DD_*`` and ``DDOGCTL_*`` variables from the environment for one test.
+
+    Unlike ``patch.dict(os.environ, clear=True)``, only the removed keys are tracked
+    and restored, rather than a copy of the whole environment.
+    """
+    for key in list(os.environ):
+        if key.startswith(("DD_", "DDOGCTL_")):
+            monkeypatch.delenv(key)
+
+
+@pytest.fixture(scope="session")
+def cli_main():
+    """The top-level ``ddogctl`` click group, imported on first use."""
+    from ddogctl.cli import main
+
+    return main
+
+
+# Assertion helpers
+
+
+def assert_all_in(output, *needles):
+    """Assert that every needle appears in ``output``, reporting all that are missing.
+
+    Args:
+        output: Text to search (typically ``result.output``)
+        *needles: Substrings expected in the output
+    """
+    missing = [needle for needle in needles if needle not in output]
+    assert not missing, f"Missing from output: {missing}"
+
+
+def assert_json_contains(output, expected):
+    """Parse JSON ``output`` once and assert it contains the expected fields.
+
+    Args:
+        output: JSON text (typically ``result.output``)
+        expected: Dict of key/value pairs the parsed object must contain, or a list
+            of such dicts matched element-wise against a parsed list of equal length
+
+    Returns:
+        The parsed JSON, for any further assertions
+    """
+    parsed = json.loads(output)
+    if isinstance(expected, list):
+        assert len(parsed) == len(expected)
+        pairs = zip(parsed, expected)
+    else:
+        pairs = [(parsed, expected)]
+    for item, fields in pairs:
+        for key, value in fields.items():
+            assert item[key] == value, f"{key}: {item.get(key)!r} != {value!r}"
+    return parsed
+
+
+# Configuration helpers
+
+
+@functools.cache
+def _validated_config(api_key, app_key, site):
+    return DatadogConfig(DD_API_KEY=api_key, DD_APP_KEY=app_key, DD_SITE=site)
+
+
+def cached_config(api_key, app_key, site="datadoghq.com"):
+    """Return a DatadogConfig for (api_key, app_key, site), validated once per distinct set.
+
+    Each call gets its own ``model_copy()``, so tests may mutate the result freely.
+    """
+    return _validated_config(api_key, app_key, site).model_copy()
+
+
 # Data factory functions for common test objects
+#
+# The mock classes live at module scope so each factory call only allocates an
+# instance instead of executing a fresh class statement. to_dict() builds a new dict on
+# every call, so callers may mutate the result freely.
+
+
+class _MockMonitor:
+    __slots__ = ("id", "message", "name", "overall_state", "query", "tags", "type")
+
+    def __init__(self, id, name, overall_state, tags, type, query):
+        self.id = id
+        self.name = name
+        self.overall_state = overall_state
+        self.tags = tags or []
+        self.type = type
+        self.query = query
+        self.message = f"Test monitor: {name}"
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "name": self.name,
+            "overall_state": str(self.overall_state),
+            "type": self.type,
+            "query": self.query,
+            "message": self.message,
+            "tags": self.tags,
+        }
 
 
 def create_mock_monitor(
@@ -76,29 +232,36 @@ def create_mock_monitor(
     Returns:
         Mock monitor object with to_dict() method
     """
-
-    class MockMonitor:
-        def __init__(self, id, name, overall_state, tags, type, query):
-            self.id = id
-            self.name = name
-            self.overall_state = overall_state
-            self.tags = tags or []
-            self.type = type
-            self.query = query
-            self.message = f"Test monitor: {name}"
-
-        def to_dict(self):
-            return {
-                "id": self.id,
-                "name": self.name,
-                "overall_state": str(self.overall_state),
-                "type": self.type,
-                "query": self.query,
-                "message": self.message,
-                "tags": self.tags,
-            }
-
-    return MockMonitor(id, name, state, tags, monitor_type, query)
+    return _MockMonitor(id, name, state, tags, monitor_type, query)
+
+
+class _MockHost:
+    __slots__ = (
+        "apps",
+        "host_name",
+        "is_up",
+        "last_reported_time",
+        "name",
+        "tags_by_source",
+    )
+
+    def __init__(self, name, is_up, apps, last_reported_time, host_name, tags_by_source):
+        self.name = name
+        self.is_up = is_up
+        self.apps = apps or []
+        self.last_reported_time = last_reported_time
+        self.host_name = host_name or name
+        self.tags_by_source = tags_by_source or {}
+
+    def to_dict(self):
+        return {
+            "name": self.name,
+            "is_up": self.is_up,
+            "apps": self.apps,
+            "last_reported_time": self.last_reported_time,
+            "host_name": self.host_name,
+            "tags_by_source": self.tags_by_source,
+        }
 
 
 def create_mock_host(
@@ -117,27 +280,21 @@ def create_mock_host(
     Returns:
         Mock host object with to_dict() method
     """
+    return _MockHost(name, is_up, apps, last_reported_time, host_name, tags_by_source)
+
 
-    class MockHost:
-        def __init__(self, name, is_up, apps, last_reported_time, host_name, tags_by_source):
-            self.name = name
-            self.is_up = is_up
-            self.apps = apps or []
-            self.last_reported_time = last_reported_time
-            self.host_name = host_name or name
-            self.tags_by_source = tags_by_source or {}
+class _MockHostListResponse:
+    __slots__ = ("host_list", "total_matching")
 
-        def to_dict(self):
-            return {
-                "name": self.name,
-                "is_up": self.is_up,
-                "apps": self.apps,
-                "last_reported_time": self.last_reported_time,
-                "host_name": self.host_name,
-                "tags_by_source": self.tags_by_source,
-            }
+    def __init__(self, host_list, total_matching):
+        self.host_list = host_list
+        self.total_matching = total_matching if total_matching is not None else len(host_list)
 
-    return MockHost(name, is_up, apps, last_reported_time, host_name, tags_by_source)
+    def to_dict(self):
+        return {
+            "host_list": [h.to_dict() for h in self.host_list],
+            "total_matching": self.total_matching,
+        }
 
 
 def create_mock_host_list_response(host_list, total_matching=None):
@@ -150,19 +307,7 @@ def create_mock_host_list_response(host_list, total_matching=None):
     Returns:
         Mock response object with host_list and total_matching attributes
     """
-
-    class MockHostListResponse:
-        def __init__(self, host_list, total_matching):
-            self.host_list = host_list
-            self.total_matching = total_matching if total_matching is not None else len(host_list)
-
-        def to_dict(self):
-            return {
-                "host_list": [h.to_dict() for h in self.host_list],
-                "total_matching": self.total_matching,
-            }
-
-    return MockHostListResponse(host_list, total_matching)
+    return _MockHostListResponse(host_list, total_matching)
 
 
 def create_mock_host_totals(total_active, total_up, total_down=None):
@@ -176,42 +321,41 @@ def create_mock_host_totals(total_active, total_up, total_down=None):
     Returns:
         Mock totals object with total_active, total_up, and optionally total_down
     """
-
-    class MockHostTotals:
-        def __init__(self, total_active, total_up, total_down):
-            self.total_active = total_active
-            self.total_up = total_up
-            if total_down is not None:
-                self.total_down = total_down
-
-    return MockHostTotals(total_active, total_up, total_down)
+    if total_down is None:
+        return SimpleNamespace(total_active=total_active, total_up=total_up)
+    return SimpleNamespace(total_active=total_active, total_up=total_up, total_down=total_down)
 
 
 # Common test data patterns
 
+
 # Typical host configurations for testing
-MOCK_HOSTS = {
-    "web_prod": create_mock_host(
-        "web-prod-01",
-        is_up=True,
-        apps=["nginx", "app"],
-        last_reported_time=1644000000,
-        tags_by_source={"Datadog": ["env:prod", "service:web"]},
-    ),
-    "web_down": create_mock_host(
-        "web-prod-02", is_up=False, apps=["nginx"], last_reported_time=1644000000
-    ),
-    "db_prod": create_mock_host(
-        "db-prod-01",
-        is_up=True,
-        apps=["postgresql"],
-        last_reported_time=1644000000,
-        tags_by_source={"Datadog": ["env:prod", "service:database"]},
-    ),
-}
+@pytest.fixture(scope="session")
+def mock_hosts():
+    """Typical host configurations, built on first use and shared for the session."""
+    return {
+        "web_prod": create_mock_host(
+            "web-prod-01",
+            is_up=True,
+            apps=["nginx", "app"],
+            last_reported_time=1644000000,
+            tags_by_source={"Datadog": ["env:prod", "service:web"]},
+        ),
+        "web_down": create_mock_host(
+            "web-prod-02", is_up=False, apps=["nginx"], last_reported_time=1644000000
+        ),
+        "db_prod": create_mock_host(
+            "db-prod-01",
+            is_up=True,
+            apps=["postgresql"],
+            last_reported_time=1644000000,
+            tags_by_source={"Datadog": ["env:prod", "service:database"]},
+        ),
+    }
 
 
 # Monitor states for testing
+@functools.lru_cache(maxsize=1)
 def get_monitor_states():
     """Get MonitorOverallStates enum for use in tests."""
     from datadog_api_client.v1.model.monitor_overall_states import MonitorOverallStates
@@ -221,6 +365,8 @@ def get_monitor_states():
 
 # APM factory functions
 
+_MICROSECOND = timedelta(microseconds=1)
+
 
 def create_mock_service_list(services):
     """Factory function to create mock ServiceDefinition list response.
@@ -229,20 +375,51 @@ def create_mock_service_list(services):
         services: List of service names (strings)
 
     Returns:
-        Mock response matching ServiceDefinitionApi.list_service_definitions()
+        Namespace response matching ServiceDefinitionApi.list_service_definitions()
     """
-    data = []
-    for name in services:
-        schema = Mock()
-        schema.dd_service = name
-        schema.team = ""
-        schema.type = "custom"
-        schema.languages = []
-        item = Mock()
-        item.attributes = Mock(schema=schema)
-        data.append(item)
-
-    return Mock(data=data)
+    data = [
+        SimpleNamespace(
+            attributes=SimpleNamespace(
+                schema=SimpleNamespace(dd_service=name, team="", type="custom", languages=[])
+            )
+        )
+        for name in services
+    ]
+    return SimpleNamespace(data=data)
+
+
+class _MockSpan:
+    __slots__ = ("attributes", "id", "type")
+
+    def __init__(self, span_id, service, resource_name, trace_id, start_ts, end_ts, duration_ns):
+        self.id = span_id
+        self.type = "span"
+        self.attributes = SimpleNamespace(
+            service=service,
+            resource_name=resource_name,
+            trace_id=trace_id,
+            span_id=span_id,
+            start_timestamp=start_ts,
+            end_timestamp=end_ts,
+            duration=duration_ns,
+        )
+
+    def to_dict(self):
+        attrs = self.attributes
+        start_ts, end_ts = attrs.start_timestamp, attrs.end_timestamp
+        return {
+            "id": self.id,
+            "type": self.type,
+            "attributes": {
+                "service": attrs.service,
+                "resource_name": attrs.resource_name,
+                "trace_id": attrs.trace_id,
+                "span_id": attrs.span_id,
+                "start_timestamp": start_ts.isoformat() if start_ts else None,
+                "end_timestamp": end_ts.isoformat() if end_ts else None,
+                "duration": attrs.duration,
+            },
+        }
 
 
 def create_mock_span(span_id, service, resource_name, trace_id, start_ts, end_ts):
@@ -259,85 +436,86 @@ def create_mock_span(span_id, service, resource_name, trace_id, start_ts, end_ts
     Returns:
         Mock Span object with attributes and duration in nanoseconds
     """
-    duration_ns = int((end_ts - start_ts).total_seconds() * 1_000_000_000)
-
-    class MockSpan:
-        def __init__(self):
-            self.id = span_id
-            self.type = "span"
-            self.attributes = Mock(
-                service=service,
-                resource_name=resource_name,
-                trace_id=trace_id,
-                span_id=span_id,
-                start_timestamp=start_ts,
-                end_timestamp=end_ts,
-                duration=duration_ns,
-            )
+    # datetimes carry microseconds, so exact integer division beats a float round-trip
+    duration_ns = (end_ts - start_ts) // _MICROSECOND * 1_000
+    return _MockSpan(span_id, service, resource_name, trace_id, start_ts, end_ts, duration_ns)
+
+
+@pytest.fixture(scope="session")
+def sample_spans():
+    """Five 100ms spans for ``test-service``, built once per session (or xdist worker).
 
-        def to_dict(self):
-            return {
-                "id": self.id,
-                "type": self.type,
-                "attributes": {
-                    "service": self.attributes.service,
-                    "resource_name": self.attributes.resource_name,
-                    "trace_id": self.attributes.trace_id,
-                    "span_id": self.attributes.span_id,
-                    "start_timestamp": (
-                        self.attributes.start_timestamp.isoformat()
-                        if self.attributes.start_timestamp
-                        else None
-                    ),
-                    "end_timestamp": (
-                        self.attributes.end_timestamp.isoformat()
-                        if self.attributes.end_timestamp
-                        else None
-                    ),
-                    "duration": self.attributes.duration,
-                },
-            }
-
-    return MockSpan()
+    Shared across tests, so treat the tuple and its spans as read-only.
+    """
+    start = datetime(2025, 1, 15, 12, 0, 0)
+    return tuple(
+        create_mock_span(
+            f"span{i}",
+            "test-service",
+            f"GET /endpoint{i}",
+            f"trace{i}",
+            start,
+            start + timedelta(milliseconds=100),
+        )
+        for i in range(5)
+    )
 
 
 # Logs factory functions
 
+_log_ids = itertools.count()
+
+
+class _MockLog:
+    __slots__ = ("attributes", "id", "type")
+
+    def __init__(self, message, service, status, timestamp, attributes, trace_id):
+        self.id = f"log-{next(_log_ids)}"
+        self.type = "log"
+        attrs = attributes or {}
+        if trace_id:
+            attrs["trace_id"] = trace_id
+        self.attributes = SimpleNamespace(
+            message=message,
+            service=service,
+            status=status,
+            timestamp=timestamp,
+            attributes=attrs,
+            tags=[f"service:{service}"],
+        )
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "attributes": {
+                "message": self.attributes.message,
+                "service": self.attributes.service,
+                "status": self.attributes.status,
+                "timestamp": str(self.attributes.timestamp),
+            },
+        }
+
 
 def create_mock_log(message, service, status, timestamp, attributes=None, trace_id=None):
     """Factory for mock log objects."""
+    return _MockLog(message, service, status, timestamp, attributes, trace_id)
 
-    class MockLog:
-        def __init__(self):
-            self.id = f"log-{abs(hash(message)) % 10000}"
-            self.type = "log"
-            attrs = attributes or {}
-            if trace_id:
-                attrs["trace_id"] = trace_id
-            self.attributes = Mock(
-                message=message,
-                service=service,
-                status=status,
-                timestamp=timestamp,
-                attributes=attrs,
-                tags=[f"service:{service}"],
-            )
 
-        def to_dict(self):
-            return {
-                "id": self.id,
-                "attributes": {
-                    "message": self.attributes.message,
-                    "service": self.attributes.service,
-                    "status": self.attributes.status,
-                    "timestamp": str(self.attributes.timestamp),
-                },
-            }
+# RUM factory functions
 
-    return MockLog()
 
+class _MockRUMEvent:
+    __slots__ = ("attributes", "id", "type")
 
-# RUM factory functions
+    def __init__(self, event_id, event_type, timestamp, attributes, tags):
+        self.id = event_id
+        self.type = event_type
+        self.attributes = SimpleNamespace(
+            type=event_type,
+            timestamp=timestamp,
+            attributes=attributes or {},
+            tags=tags or [],
+        )
 
 
 def create_mock_rum_event(event_id, event_type, timestamp, attributes=None, tags=None):
@@ -353,91 +531,97 @@ def create_mock_rum_event(event_id, event_type, timestamp, attributes=None, tags
     Returns:
         Mock RUM event object
     """
-
-    class MockRUMEvent:
-        def __init__(self):
-            self.id = event_id
-            self.type = event_type
-            self.attributes = Mock(
-                type=event_type,
-                timestamp=timestamp,
-                attributes=attributes or {},
-                tags=tags or [],
-            )
-
-    return MockRUMEvent()
+    return _MockRUMEvent(event_id, event_type, timestamp, attributes, tags)
 
 
 # DBM factory functions
 
 
-def create_mock_dbm_host(host, engine, version, connections, status):
-    """Factory for mock DBM host objects."""
+class _MockDBMHost:
+    __slots__ = ("connections", "engine", "host", "status", "version")
 
-    class MockDBMHost:
-        def __init__(self):
-            self.host = host
-            self.engine = engine
-            self.version = version
-            self.connections = connections
-            self.status = status
+    def __init__(self, host, engine, version, connections, status):
+        self.host = host
+        self.engine = engine
+        self.version = version
+        self.connections = connections
+        self.status = status
 
-        def to_dict(self):
-            return {
-                "host": self.host,
-                "engine": self.engine,
-                "version": self.version,
-                "connections": self.connections,
-                "status": self.status,
-            }
+    def to_dict(self):
+        return {
+            "host": self.host,
+            "engine": self.engine,
+            "version": self.version,
+            "connections": self.connections,
+            "status": self.status,
+        }
 
-    return MockDBMHost()
+
+def create_mock_dbm_host(host, engine, version, connections, status):
+    """Factory for mock DBM host objects."""
+    return _MockDBMHost(host, engine, version, connections, status)
+
+
+class _MockDBMQuery:
+    __slots__ = (
+        "avg_latency",
+        "calls",
+        "database",
+        "normalized_query",
+        "query_id",
+        "service",
+        "total_time",
+    )
+
+    def __init__(
+        self, query_id, normalized_query, avg_latency_ms, calls, total_time_ms, service, database
+    ):
+        self.query_id = query_id
+        self.normalized_query = normalized_query
+        self.avg_latency = avg_latency_ms * 1_000_000  # ns
+        self.calls = calls
+        self.total_time = total_time_ms * 1_000_000  # ns
+        self.service = service
+        self.database = database
+
+    def to_dict(self):
+        return {
+            "query_id": self.query_id,
+            "normalized_query": self.normalized_query,
+            "avg_latency_ms": self.avg_latency / 1_000_000,
+            "calls": self.calls,
+            "total_time_ms": self.total_time / 1_000_000,
+            "service": self.service,
+            "database": self.database,
+        }
 
 
 def create_mock_dbm_query(
     query_id, normalized_query, avg_latency_ms, calls, total_time_ms, service, database
 ):
     """Factory for mock DBM query objects."""
+    return _MockDBMQuery(
+        query_id, normalized_query, avg_latency_ms, calls, total_time_ms, service, database
+    )
+
+
+class _MockDBMSample:
+    __slots__ = ("duration", "parameters", "rows_affected", "timestamp")
 
-    class MockDBMQuery:
-        def __init__(self):
-            self.query_id = query_id
-            self.normalized_query = normalized_query
-            self.avg_latency = avg_latency_ms * 1_000_000  # ns
-            self.calls = calls
-            self.total_time = total_time_ms * 1_000_000  # ns
-            self.service = service
-            self.database = database
-
-        def to_dict(self):
-            return {
-                "query_id": self.query_id,
-                "normalized_query": self.normalized_query,
-                "avg_latency_ms": avg_latency_ms,
-                "calls": self.calls,
-                "total_time_ms": total_time_ms,
-                "service": self.service,
-                "database": self.database,
-            }
-
-    return MockDBMQuery()
+    def __init__(self, timestamp, duration_ms, rows_affected, params):
+        self.timestamp = timestamp
+        self.duration = duration_ms * 1_000_000  # ns
+        self.rows_affected = rows_affected
+        self.parameters = params
+
+    def to_dict(self):
+        return {
+            "timestamp": str(self.timestamp),
+            "duration_ms": self.duration / 1_000_000,
+            "rows_affected": self.rows_affected,
+        }
 
 
 def create_mock_dbm_sample(timestamp, duration_ms, rows_affected, params):
     """Factory for mock DBM query sample objects."""
-
-    class MockDBMSample:
-        def __init__(self):
-            self.timestamp = timestamp
-            self.duration = duration_ms * 1_000_000  # ns
-            self.rows_affected = rows_affected
-            self.parameters = params
-
-        def to_dict(self):
-            return {
-                "timestamp": str(self.timestamp),
-                "duration_ms": duration_ms,
-                "rows_affected": self.rows_affected,
-            }
-
-    return MockDBMSample()
+    return _MockDBMSample(timestamp, duration_ms, rows_affected, params)
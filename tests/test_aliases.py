@@ -1,51 +1,42 @@
 """Tests for command aliases."""
 
+import click
+import pytest
 from unittest.mock import patch, Mock
-from click.testing import CliRunner
 from ddogctl.cli import main
 
 
-class TestAliasResolution:
-    """Tests that short aliases resolve to full command groups."""
-
-    def test_mon_resolves_to_monitor(self):
-        runner = CliRunner()
-        result = runner.invoke(main, ["mon", "--help"])
-        assert result.exit_code == 0
-        # Should show monitor group help
-        assert "monitor" in result.output.lower() or "Monitor" in result.output
-
-    def test_dash_resolves_to_dashboard(self):
-        runner = CliRunner()
-        result = runner.invoke(main, ["dash", "--help"])
-        assert result.exit_code == 0
-        assert "dashboard" in result.output.lower() or "Dashboard" in result.output
+@pytest.fixture(scope="session")
+def click_ctx():
+    """Context for resolving commands on ``main`` without invoking it."""
+    return click.Context(main)
 
-    def test_dt_resolves_to_downtime(self):
-        runner = CliRunner()
-        result = runner.invoke(main, ["dt", "--help"])
-        assert result.exit_code == 0
-        assert "downtime" in result.output.lower() or "Downtime" in result.output
 
-    def test_sc_resolves_to_service_check(self):
-        runner = CliRunner()
-        result = runner.invoke(main, ["sc", "--help"])
-        assert result.exit_code == 0
-        assert "service" in result.output.lower() or "Service" in result.output
+class TestAliasResolution:
+    """Tests that short aliases resolve to full command groups."""
 
-    def test_inv_resolves_to_investigate(self):
-        runner = CliRunner()
-        result = runner.invoke(main, ["inv", "--help"])
-        assert result.exit_code == 0
-        assert "investigate" in result.output.lower() or "Investigate" in result.output
+    @pytest.mark.parametrize(
+        "alias,command",
+        [
+            ("mon", "monitor"),
+            ("dash", "dashboard"),
+            ("dt", "downtime"),
+            ("sc", "service-check"),
+            ("inv", "investigate"),
+        ],
+    )
+    def test_alias_resolves(self, click_ctx, alias, command):
+        # Resolution only needs the group lookup, not a full invoke rendering --help
+        cmd = main.get_command(click_ctx, alias)
+        assert cmd is not None
+        assert cmd.name == command
 
 
 class TestAliasSubcommands:
     """Tests that aliases work with subcommands."""
 
-    def test_mon_list_works(self):
+    def test_mon_list_works(self, runner):
         """mon list should invoke monitor list."""
-        runner = CliRunner()
         with patch("ddogctl.commands.monitor.get_datadog_client") as mock_get:
             mock_client = Mock()
             mock_client.monitors = Mock()
@@ -54,9 +45,8 @@ class TestAliasSubcommands:
             result = runner.invoke(main, ["mon", "list"])
             assert result.exit_code == 0
 
-    def test_inv_with_subcommand(self):
+    def test_inv_with_subcommand(self, runner):
         """inv should accept investigate subcommands."""
-        runner = CliRunner()
         # Just verify the alias resolves and the subcommand help is accessible
         result = runner.invoke(main, ["inv", "latency", "--help"])
         assert result.exit_code == 0
@@ -65,41 +55,24 @@ class TestAliasSubcommands:
 class TestFullCommandsStillWork:
     """Tests that full command names still work alongside aliases."""
 
-    def test_monitor_still_works(self):
-        runner = CliRunner()
-        result = runner.invoke(main, ["monitor", "--help"])
-        assert result.exit_code == 0
-
-    def test_dashboard_still_works(self):
-        runner = CliRunner()
-        result = runner.invoke(main, ["dashboard", "--help"])
-        assert result.exit_code == 0
-
-    def test_downtime_still_works(self):
-        runner = CliRunner()
-        result = runner.invoke(main, ["downtime", "--help"])
-        assert result.exit_code == 0
-
-    def test_service_check_still_works(self):
-        runner = CliRunner()
-        result = runner.invoke(main, ["service-check", "--help"])
-        assert result.exit_code == 0
-
-    def test_investigate_still_works(self):
-        runner = CliRunner()
-        result = runner.invoke(main, ["investigate", "--help"])
-        assert result.exit_code == 0
+    @pytest.mark.parametrize(
+        "command", ["monitor", "dashboard", "downtime", "service-check", "investigate"]
+    )
+    def test_full_command_still_works(self, click_ctx, command):
+        # Render help straight from the command tree, without a runner invoke
+        cmd = main.get_command(click_ctx, command)
+        assert cmd is not None
+        help_text = cmd.get_help(click.Context(cmd, info_name=command, parent=click_ctx))
+        assert f"Usage: {command}" in help_text
 
 
 class TestUnknownCommand:
     """Tests that unknown commands still fail properly."""
 
-    def test_unknown_command_fails(self):
-        runner = CliRunner()
+    def test_unknown_command_fails(self, runner):
         result = runner.invoke(main, ["nonexistent"])
         assert result.exit_code != 0
 
-    def test_unknown_alias_fails(self):
-        runner = CliRunner()
+    def test_unknown_alias_fails(self, runner):
         result = runner.invoke(main, ["xyz"])
         assert result.exit_code != 0
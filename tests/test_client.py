@@ -2,36 +2,78 @@
 
 import pytest
 from unittest.mock import Mock, patch
+import ddogctl.client as client_module
 from ddogctl.client import DatadogClient, get_datadog_client
-from ddogctl.config import DatadogConfig
+from tests.conftest import cached_config
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_config():
     """Create a mock DatadogConfig."""
-    return DatadogConfig(
-        DD_API_KEY="test_api_key", DD_APP_KEY="test_app_key", DD_SITE="datadoghq.com"
-    )
+    return cached_config("test_api_key", "test_app_key", "datadoghq.com")
 
 
-@pytest.fixture
-def mock_api_client():
-    """Create a mock ApiClient."""
+@pytest.fixture(scope="module")
+def _api_client_patch():
+    """Patch ApiClient once for the module."""
     with patch("ddogctl.client.ApiClient") as mock_client_class:
-        mock_instance = Mock()
-        mock_client_class.return_value = mock_instance
-        yield mock_client_class, mock_instance
+        mock_client_class.return_value = Mock()
+        yield mock_client_class
 
 
-@pytest.fixture
-def mock_configuration():
-    """Create a mock Configuration."""
+@pytest.fixture(scope="module")
+def _configuration_patch():
+    """Patch Configuration once for the module."""
     with patch("ddogctl.client.Configuration") as mock_config_class:
-        mock_instance = Mock()
-        mock_instance.api_key = {}
-        mock_instance.server_variables = {}
-        mock_config_class.return_value = mock_instance
-        yield mock_config_class, mock_instance
+        mock_config_class.return_value = Mock()
+        yield mock_config_class
+
+
+@pytest.fixture
+def mock_api_client(_api_client_patch):
+    """Create a mock ApiClient, cleared of calls from earlier tests."""
+    _api_client_patch.reset_mock()
+    mock_instance = _api_client_patch.return_value
+    mock_instance.reset_mock()
+    return _api_client_patch, mock_instance
+
+
+@pytest.fixture
+def mock_configuration(_configuration_patch):
+    """Create a mock Configuration with empty key and server variable dicts."""
+    _configuration_patch.reset_mock()
+    mock_instance = _configuration_patch.return_value
+    mock_instance.reset_mock()
+    mock_instance.api_key = {}
+    mock_instance.server_variables = {}
+    return _configuration_patch, mock_instance
+
+
+# Client attribute -> (API module name in ddogctl.client, API class name)
+API_CLASSES = {
+    "monitors": ("monitors_api", "MonitorsApi"),
+    "metrics": ("metrics_api", "MetricsApi"),
+    "events": ("events_api", "EventsApi"),
+    "hosts": ("hosts_api", "HostsApi"),
+    "tags": ("tags_api", "TagsApi"),
+    "logs": ("logs_api", "LogsApi"),
+}
+
+
+@pytest.fixture
+def mocked_apis(monkeypatch):
+    """Replace the API classes in API_CLASSES with mocks, keyed by client attribute."""
+    mocks = {}
+    for attr, (module_name, class_name) in API_CLASSES.items():
+        mocks[attr] = Mock()
+        monkeypatch.setattr(getattr(client_module, module_name), class_name, mocks[attr])
+    return mocks
+
+
+@pytest.fixture
+def client(mocked_apis, mock_config, mock_configuration, mock_api_client):
+    """DatadogClient built against the mocked API classes."""
+    return DatadogClient(mock_config)
 
 
 class TestDatadogClient:
@@ -58,54 +100,24 @@ class TestDatadogClient:
         # Verify api_client attribute is set
         assert client.api_client == mock_client_instance
 
-    @patch("ddogctl.client.monitors_api.MonitorsApi")
-    @patch("ddogctl.client.metrics_api.MetricsApi")
-    @patch("ddogctl.client.events_api.EventsApi")
-    @patch("ddogctl.client.hosts_api.HostsApi")
-    @patch("ddogctl.client.tags_api.TagsApi")
-    @patch("ddogctl.client.logs_api.LogsApi")
     def test_api_endpoints_initialized(
-        self,
-        mock_logs_api,
-        mock_tags_api,
-        mock_hosts_api,
-        mock_events_api,
-        mock_metrics_api,
-        mock_monitors_api,
-        mock_config,
-        mock_configuration,
-        mock_api_client,
+        self, mocked_apis, mock_config, mock_configuration, mock_api_client
     ):
         """Test that all API endpoints are initialized."""
         _, mock_client_instance = mock_api_client
 
         client = DatadogClient(mock_config)
 
-        # Verify V1 APIs were initialized
-        mock_monitors_api.assert_called_once_with(mock_client_instance)
-        mock_metrics_api.assert_called_once_with(mock_client_instance)
-        mock_events_api.assert_called_once_with(mock_client_instance)
-        mock_hosts_api.assert_called_once_with(mock_client_instance)
-        mock_tags_api.assert_called_once_with(mock_client_instance)
-
-        # Verify V2 APIs were initialized
-        mock_logs_api.assert_called_once_with(mock_client_instance)
-
-        # Verify API attributes are set
-        assert hasattr(client, "monitors")
-        assert hasattr(client, "metrics")
-        assert hasattr(client, "events")
-        assert hasattr(client, "hosts")
-        assert hasattr(client, "tags")
-        assert hasattr(client, "logs")
+        # Verify V1 and V2 APIs were initialized with the shared ApiClient
+        for attr, api_class in mocked_apis.items():
+            api_class.assert_called_once_with(mock_client_instance)
+            assert getattr(client, attr) is api_class.return_value
 
     def test_client_with_custom_site(self, mock_configuration, mock_api_client):
         """Test client initialization with custom site."""
         _, mock_config_instance = mock_configuration
 
-        custom_config = DatadogConfig(
-            DD_API_KEY="test_api_key", DD_APP_KEY="test_app_key", DD_SITE="datadoghq.eu"
-        )
+        custom_config = cached_config("test_api_key", "test_app_key", "datadoghq.eu")
 
         DatadogClient(custom_config)
 
@@ -117,9 +129,7 @@ class TestDatadogClient:
         _, mock_config_instance = mock_configuration
 
         # Config with region shortcut (will be expanded by DatadogConfig)
-        custom_config = DatadogConfig(
-            DD_API_KEY="test_api_key", DD_APP_KEY="test_app_key", DD_SITE="us3"
-        )
+        custom_config = cached_config("test_api_key", "test_app_key", "us3")
 
         DatadogClient(custom_config)
 
@@ -140,7 +150,6 @@ class TestContextManager:
     def test_context_manager_exit(self, mock_config, mock_configuration, mock_api_client):
         """Test that __exit__ closes the API client."""
         _, mock_client_instance = mock_api_client
-        mock_client_instance.close = Mock()
 
         client = DatadogClient(mock_config)
 
@@ -155,7 +164,6 @@ class TestContextManager:
     ):
         """Test that __exit__ closes the API client even when exception occurs."""
         _, mock_client_instance = mock_api_client
-        mock_client_instance.close = Mock()
 
         client = DatadogClient(mock_config)
 
@@ -199,9 +207,7 @@ class TestGetDatadogClient:
     ):
         """Test that get_datadog_client returns a properly configured client."""
         # Create a real config for testing
-        test_config = DatadogConfig(
-            DD_API_KEY="test_api_key", DD_APP_KEY="test_app_key", DD_SITE="datadoghq.com"
-        )
+        test_config = cached_config("test_api_key", "test_app_key", "datadoghq.com")
         mock_load_config.return_value = test_config
 
         mock_client_instance = Mock()
@@ -221,77 +227,10 @@ class TestGetDatadogClient:
 class TestClientAPIAccess:
     """Tests for accessing API endpoints through the client."""
 
-    @patch("ddogctl.client.monitors_api.MonitorsApi")
-    def test_monitors_api_accessible(
-        self, mock_monitors_api, mock_config, mock_configuration, mock_api_client
-    ):
-        """Test that monitors API is accessible through client."""
-        mock_monitors_instance = Mock()
-        mock_monitors_api.return_value = mock_monitors_instance
-
-        client = DatadogClient(mock_config)
-
-        assert client.monitors == mock_monitors_instance
-
-    @patch("ddogctl.client.metrics_api.MetricsApi")
-    def test_metrics_api_accessible(
-        self, mock_metrics_api, mock_config, mock_configuration, mock_api_client
-    ):
-        """Test that metrics API is accessible through client."""
-        mock_metrics_instance = Mock()
-        mock_metrics_api.return_value = mock_metrics_instance
-
-        client = DatadogClient(mock_config)
-
-        assert client.metrics == mock_metrics_instance
-
-    @patch("ddogctl.client.events_api.EventsApi")
-    def test_events_api_accessible(
-        self, mock_events_api, mock_config, mock_configuration, mock_api_client
-    ):
-        """Test that events API is accessible through client."""
-        mock_events_instance = Mock()
-        mock_events_api.return_value = mock_events_instance
-
-        client = DatadogClient(mock_config)
-
-        assert client.events == mock_events_instance
-
-    @patch("ddogctl.client.hosts_api.HostsApi")
-    def test_hosts_api_accessible(
-        self, mock_hosts_api, mock_config, mock_configuration, mock_api_client
-    ):
-        """Test that hosts API is accessible through client."""
-        mock_hosts_instance = Mock()
-        mock_hosts_api.return_value = mock_hosts_instance
-
-        client = DatadogClient(mock_config)
-
-        assert client.hosts == mock_hosts_instance
-
-    @patch("ddogctl.client.tags_api.TagsApi")
-    def test_tags_api_accessible(
-        self, mock_tags_api, mock_config, mock_configuration, mock_api_client
-    ):
-        """Test that tags API is accessible through client."""
-        mock_tags_instance = Mock()
-        mock_tags_api.return_value = mock_tags_instance
-
-        client = DatadogClient(mock_config)
-
-        assert client.tags == mock_tags_instance
-
-    @patch("ddogctl.client.logs_api.LogsApi")
-    def test_logs_api_accessible(
-        self, mock_logs_api, mock_config, mock_configuration, mock_api_client
-    ):
-        """Test that logs API (V2) is accessible through client."""
-        mock_logs_instance = Mock()
-        mock_logs_api.return_value = mock_logs_instance
-
-        client = DatadogClient(mock_config)
-
-        assert client.logs == mock_logs_instance
+    @pytest.mark.parametrize("attr", list(API_CLASSES))
+    def test_api_accessible(self, attr, client, mocked_apis):
+        """Test that each API is accessible through the client."""
+        assert getattr(client, attr) is mocked_apis[attr].return_value
 
 
 class TestClientConfiguration:
@@ -301,9 +240,7 @@ class TestClientConfiguration:
         """Test that client uses the API key from config."""
         _, mock_config_instance = mock_configuration
 
-        config = DatadogConfig(
-            DD_API_KEY="specific_api_key", DD_APP_KEY="test_app_key", DD_SITE="datadoghq.com"
-        )
+        config = cached_config("specific_api_key", "test_app_key", "datadoghq.com")
 
         DatadogClient(config)
 
@@ -313,9 +250,7 @@ class TestClientConfiguration:
         """Test that client uses the APP key from config."""
         _, mock_config_instance = mock_configuration
 
-        config = DatadogConfig(
-            DD_API_KEY="test_api_key", DD_APP_KEY="specific_app_key", DD_SITE="datadoghq.com"
-        )
+        config = cached_config("test_api_key", "specific_app_key", "datadoghq.com")
 
         DatadogClient(config)
 
@@ -325,9 +260,7 @@ class TestClientConfiguration:
         """Test that client uses the site from config."""
         _, mock_config_instance = mock_configuration
 
-        config = DatadogConfig(
-            DD_API_KEY="test_api_key", DD_APP_KEY="test_app_key", DD_SITE="custom.datadoghq.com"
-        )
+        config = cached_config("test_api_key", "test_app_key", "custom.datadoghq.com")
 
         DatadogClient(config)
 
@@ -350,10 +283,10 @@ class TestClientConfiguration:
         """Test that client correctly handles region shortcuts via config."""
         _, mock_config_instance = mock_configuration
 
-        config = DatadogConfig(
-            DD_API_KEY="test_api_key", DD_APP_KEY="test_app_key", DD_SITE=site_input
-        )
+        # Build through the validated DatadogConfig constructor so the site validator runs
+        config = cached_config("test_api_key", "test_app_key", site_input)
 
-        DatadogClient(config)
+        with patch("ddogctl.config.load_config", return_value=config):
+            get_datadog_client()
 
         assert mock_config_instance.server_variables["site"] == expected_site
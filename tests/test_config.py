@@ -4,14 +4,27 @@ import pytest
 from unittest.mock import patch
 from pydantic import ValidationError
 from ddogctl.config import DatadogConfig, load_config
+from tests.conftest import assert_all_in
+
+# Built once: from_exception_data goes through pydantic-core error construction
+_MISSING_APP_KEY_ERR = ValidationError.from_exception_data(
+    "DatadogConfig",
+    [{"type": "missing", "loc": ("DD_APP_KEY",), "msg": "Field required", "input": {}}],
+)
+
+
+@pytest.fixture
+def default_config(clean_dd_env):
+    """Config with only the required keys set and no environment or .env overrides."""
+    return DatadogConfig(_env_file=None, DD_API_KEY="test_api_key", DD_APP_KEY="test_app_key")
 
 
 class TestDatadogConfig:
     """Tests for DatadogConfig class."""
 
-    def test_config_with_all_required_fields(self):
+    def test_config_with_all_required_fields(self, clean_dd_env):
         """Test configuration with all required fields."""
-        config = DatadogConfig(DD_API_KEY="test_api_key", DD_APP_KEY="test_app_key")
+        config = DatadogConfig(_env_file=None, DD_API_KEY="test_api_key", DD_APP_KEY="test_app_key")
 
         assert config.api_key == "test_api_key"
         assert config.app_key == "test_app_key"
@@ -25,30 +38,20 @@ class TestDatadogConfig:
 
         assert config.site == "custom.datadoghq.com"
 
-    @patch.dict("os.environ", {}, clear=True)
-    def test_config_missing_api_key(self):
+    def test_config_missing_api_key(self, clean_dd_env):
         """Test that missing API key raises validation error."""
         with pytest.raises(ValidationError) as exc_info:
             DatadogConfig(_env_file=None, DD_APP_KEY="test_app_key")
 
         assert "DD_API_KEY" in str(exc_info.value)
 
-    @patch.dict("os.environ", {}, clear=True)
-    def test_config_missing_app_key(self):
+    def test_config_missing_app_key(self, clean_dd_env):
         """Test that missing APP key raises validation error."""
         with pytest.raises(ValidationError) as exc_info:
             DatadogConfig(_env_file=None, DD_API_KEY="test_api_key")
 
         assert "DD_APP_KEY" in str(exc_info.value)
 
-    def test_config_default_client_settings(self):
-        """Test default client settings."""
-        config = DatadogConfig(DD_API_KEY="test_api_key", DD_APP_KEY="test_app_key")
-
-        assert config.timeout == 30
-        assert config.retry_count == 3
-        assert config.retry_delay == 1.0
-
     def test_config_custom_client_settings(self):
         """Test custom client settings."""
         config = DatadogConfig(
@@ -63,13 +66,6 @@ class TestDatadogConfig:
         assert config.retry_count == 5
         assert config.retry_delay == 2.5
 
-    def test_config_default_display_options(self):
-        """Test default display options."""
-        config = DatadogConfig(DD_API_KEY="test_api_key", DD_APP_KEY="test_app_key")
-
-        assert config.default_format == "table"
-        assert config.color_output is True
-
     def test_config_custom_display_options(self):
         """Test custom display options."""
         config = DatadogConfig(
@@ -82,11 +78,20 @@ class TestDatadogConfig:
         assert config.default_format == "json"
         assert config.color_output is False
 
-    def test_config_default_time_range(self):
-        """Test default time range."""
-        config = DatadogConfig(DD_API_KEY="test_api_key", DD_APP_KEY="test_app_key")
-
-        assert config.default_time_range == "1h"
+    @pytest.mark.parametrize(
+        "attr,expected",
+        [
+            ("timeout", 30),
+            ("retry_count", 3),
+            ("retry_delay", 1.0),
+            ("default_format", "table"),
+            ("color_output", True),
+            ("default_time_range", "1h"),
+        ],
+    )
+    def test_config_defaults(self, default_config, attr, expected):
+        """Test default client settings, display options and time range."""
+        assert getattr(default_config, attr) == expected
 
 
 class TestRegionShortcuts:
@@ -165,12 +170,7 @@ class TestLoadConfig:
     def test_load_config_missing_credentials_exits(self, mock_config_class, mock_console):
         """Test that load_config exits when credentials are missing."""
         # Make DatadogConfig raise ValidationError
-        from pydantic import ValidationError as PydanticValidationError
-
-        mock_config_class.side_effect = PydanticValidationError.from_exception_data(
-            "DatadogConfig",
-            [{"type": "missing", "loc": ("DD_APP_KEY",), "msg": "Field required", "input": {}}],
-        )
+        mock_config_class.side_effect = _MISSING_APP_KEY_ERR
 
         with pytest.raises(SystemExit) as exc_info:
             load_config()
@@ -179,13 +179,11 @@ class TestLoadConfig:
 
         # Verify error messages were printed
         mock_console.print.assert_called()
-        calls = [str(call) for call in mock_console.print.call_args_list]
-        assert any("Configuration error" in str(call) for call in calls)
-        assert any("DD_API_KEY" in str(call) for call in calls)
-        assert any("DD_APP_KEY" in str(call) for call in calls)
+        printed = " ".join(str(call) for call in mock_console.print.call_args_list)
+        assert_all_in(printed, "Configuration error", "DD_API_KEY", "DD_APP_KEY")
 
     @patch.dict("os.environ", {"DD_API_KEY": "env_api_key", "DD_APP_KEY": "env_app_key"})
-    def test_load_config_with_defaults(self):
+    def test_load_config_with_defaults(self, clean_dd_env):
         """Test that load_config applies default values correctly."""
         config = load_config()
 
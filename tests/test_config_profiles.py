@@ -1,216 +1,126 @@
 """Tests for profile loading integration in config.py."""
 
-import json
 from unittest.mock import patch
 
 import pytest
+import ddogctl.config as config_module
 from ddogctl.config import load_config
 
+# Parsed ~/.ddogctl/config.json contents, handed to load_config(config_data=...)
+# so most profile tests skip the filesystem
+CONFIG_DATA_PROD_STAGING = {
+    "active_profile": "prod",
+    "profiles": {
+        "prod": {
+            "api_key": "prod-key",
+            "app_key": "prod-app",
+            "site": "datadoghq.com",
+        },
+        "staging": {
+            "api_key": "staging-key",
+            "app_key": "staging-app",
+            "site": "datadoghq.eu",
+        },
+    },
+}
+
+# The same contents as written to disk, for the one test that reads a real file
+_PROD_STAGING_JSON = (
+    b'{"active_profile": "prod", "profiles": {'
+    b'"prod": {"api_key": "prod-key", "app_key": "prod-app", "site": "datadoghq.com"}, '
+    b'"staging": {"api_key": "staging-key", "app_key": "staging-app", "site": "datadoghq.eu"}}}'
+)
+
+
+@pytest.fixture(scope="session")
+def ddogctl_config_dir(tmp_path_factory):
+    """A ``.ddogctl`` directory shared by the tests; each uses its own file name in it."""
+    config_dir = tmp_path_factory.mktemp("ddogctl_tests") / ".ddogctl"
+    config_dir.mkdir()
+    return config_dir
+
+
+@pytest.fixture
+def patched_config_path(monkeypatch, ddogctl_config_dir, request):
+    """Point ``get_config_path`` at a per-test file (not yet written) in the shared dir."""
+    config_file = ddogctl_config_dir / f"{request.node.name}.json"
+    monkeypatch.setattr(config_module, "get_config_path", lambda: str(config_file))
+    return config_file
+
 
 class TestLoadConfigWithProfiles:
     """Tests for load_config with profile support."""
 
-    @patch.dict("os.environ", {"DD_API_KEY": "env-key", "DD_APP_KEY": "env-app"}, clear=False)
-    def test_env_vars_take_precedence_over_profile(self, tmp_path):
+    def test_env_vars_take_precedence_over_profile(self, clean_dd_env, monkeypatch):
         """Test that env vars override profile values."""
-        config_dir = tmp_path / ".ddogctl"
-        config_dir.mkdir(parents=True)
-        config_file = config_dir / "config.json"
-
-        config_data = {
-            "active_profile": "prod",
-            "profiles": {
-                "prod": {
-                    "api_key": "profile-key",
-                    "app_key": "profile-app",
-                    "site": "datadoghq.eu",
-                }
-            },
-        }
-        config_file.write_text(json.dumps(config_data))
+        monkeypatch.setenv("DD_API_KEY", "env-key")
+        monkeypatch.setenv("DD_APP_KEY", "env-app")
 
-        with patch("ddogctl.config.get_config_path", return_value=str(config_file)):
-            config = load_config()
+        config = load_config(config_data=CONFIG_DATA_PROD_STAGING)
 
         # Env vars should win
         assert config.api_key == "env-key"
         assert config.app_key == "env-app"
 
-    @patch.dict("os.environ", {}, clear=True)
-    def test_loads_from_active_profile_when_no_env_vars(self, tmp_path):
+    def test_loads_from_active_profile_when_no_env_vars(self, clean_dd_env):
         """Test loading config from active profile when env vars are missing."""
-        config_dir = tmp_path / ".ddogctl"
-        config_dir.mkdir(parents=True)
-        config_file = config_dir / "config.json"
-
-        config_data = {
-            "active_profile": "prod",
-            "profiles": {
-                "prod": {
-                    "api_key": "profile-key",
-                    "app_key": "profile-app",
-                    "site": "datadoghq.com",
-                }
-            },
-        }
-        config_file.write_text(json.dumps(config_data))
+        config = load_config(config_data=CONFIG_DATA_PROD_STAGING)
 
-        with patch("ddogctl.config.get_config_path", return_value=str(config_file)):
-            config = load_config()
-
-        assert config.api_key == "profile-key"
-        assert config.app_key == "profile-app"
+        assert config.api_key == "prod-key"
+        assert config.app_key == "prod-app"
         assert config.site == "datadoghq.com"
 
-    @patch.dict("os.environ", {}, clear=True)
-    def test_loads_named_profile(self, tmp_path):
-        """Test loading a specific named profile."""
-        config_dir = tmp_path / ".ddogctl"
-        config_dir.mkdir(parents=True)
-        config_file = config_dir / "config.json"
-
-        config_data = {
-            "active_profile": "prod",
-            "profiles": {
-                "prod": {
-                    "api_key": "prod-key",
-                    "app_key": "prod-app",
-                    "site": "datadoghq.com",
-                },
-                "staging": {
-                    "api_key": "staging-key",
-                    "app_key": "staging-app",
-                    "site": "datadoghq.eu",
-                },
-            },
-        }
-        config_file.write_text(json.dumps(config_data))
-
-        with patch("ddogctl.config.get_config_path", return_value=str(config_file)):
-            config = load_config(profile="staging")
-
-        assert config.api_key == "staging-key"
-        assert config.app_key == "staging-app"
-        assert config.site == "datadoghq.eu"
-
-    @patch.dict("os.environ", {"DDOGCTL_PROFILE": "staging"}, clear=True)
-    def test_loads_profile_from_env_var(self, tmp_path):
-        """Test loading profile specified via DDOGCTL_PROFILE env var."""
-        config_dir = tmp_path / ".ddogctl"
-        config_dir.mkdir(parents=True)
-        config_file = config_dir / "config.json"
-
-        config_data = {
-            "active_profile": "prod",
-            "profiles": {
-                "prod": {
-                    "api_key": "prod-key",
-                    "app_key": "prod-app",
-                    "site": "datadoghq.com",
-                },
-                "staging": {
-                    "api_key": "staging-key",
-                    "app_key": "staging-app",
-                    "site": "datadoghq.eu",
-                },
-            },
-        }
-        config_file.write_text(json.dumps(config_data))
-
-        with patch("ddogctl.config.get_config_path", return_value=str(config_file)):
-            config = load_config()
+    @pytest.mark.parametrize(
+        "env,profile,expected_api_key,expected_site",
+        [
+            ({}, "staging", "staging-key", "datadoghq.eu"),
+            ({"DDOGCTL_PROFILE": "staging"}, None, "staging-key", "datadoghq.eu"),
+            ({"DDOGCTL_PROFILE": "prod"}, "staging", "staging-key", "datadoghq.eu"),
+            ({}, "nonexistent", None, None),
+        ],
+        ids=["named_profile", "profile_from_env_var", "cli_overrides_env_var", "nonexistent"],
+    )
+    def test_profile_selection(
+        self, clean_dd_env, monkeypatch, env, profile, expected_api_key, expected_site
+    ):
+        """Test which profile is loaded from the CLI argument and DDOGCTL_PROFILE."""
+        for key, value in env.items():
+            monkeypatch.setenv(key, value)
+
+        if expected_api_key is None:
+            # Requesting a profile that doesn't exist exits with an error
+            with patch("ddogctl.config.console"), pytest.raises(SystemExit):
+                load_config(profile=profile, config_data=CONFIG_DATA_PROD_STAGING)
+            return
+
+        config = load_config(profile=profile, config_data=CONFIG_DATA_PROD_STAGING)
+
+        assert config.api_key == expected_api_key
+        assert config.site == expected_site
+
+    def test_reads_profiles_from_config_file(self, clean_dd_env, patched_config_path):
+        """Test that profiles are read from the config file when no data is passed."""
+        patched_config_path.write_bytes(_PROD_STAGING_JSON)
+
+        config = load_config(profile="staging")
 
         assert config.api_key == "staging-key"
         assert config.site == "datadoghq.eu"
 
-    @patch.dict("os.environ", {}, clear=True)
-    def test_cli_profile_overrides_env_var_profile(self, tmp_path):
-        """Test that explicit profile param overrides DDOGCTL_PROFILE env var."""
-        config_dir = tmp_path / ".ddogctl"
-        config_dir.mkdir(parents=True)
-        config_file = config_dir / "config.json"
-
-        config_data = {
-            "active_profile": "prod",
-            "profiles": {
-                "prod": {
-                    "api_key": "prod-key",
-                    "app_key": "prod-app",
-                    "site": "datadoghq.com",
-                },
-                "staging": {
-                    "api_key": "staging-key",
-                    "app_key": "staging-app",
-                    "site": "datadoghq.eu",
-                },
-            },
-        }
-        config_file.write_text(json.dumps(config_data))
-
-        with patch("ddogctl.config.get_config_path", return_value=str(config_file)):
-            config = load_config(profile="staging")
-
-        assert config.api_key == "staging-key"
-
-    @patch.dict("os.environ", {}, clear=True)
-    def test_nonexistent_profile_exits(self, tmp_path):
-        """Test that requesting a nonexistent profile exits with error."""
-        config_dir = tmp_path / ".ddogctl"
-        config_dir.mkdir(parents=True)
-        config_file = config_dir / "config.json"
-
-        config_data = {
-            "active_profile": "prod",
-            "profiles": {
-                "prod": {
-                    "api_key": "key",
-                    "app_key": "app",
-                    "site": "datadoghq.com",
-                }
-            },
-        }
-        config_file.write_text(json.dumps(config_data))
-
-        with (
-            patch("ddogctl.config.get_config_path", return_value=str(config_file)),
-            patch("ddogctl.config.console"),
-            pytest.raises(SystemExit),
-        ):
-            load_config(profile="nonexistent")
-
-    @patch.dict("os.environ", {}, clear=True)
-    def test_no_config_file_and_no_env_vars_exits(self, tmp_path):
+    def test_no_config_file_and_no_env_vars_exits(self, clean_dd_env, patched_config_path):
         """Test that missing config file and env vars exits with error."""
-        config_file = tmp_path / "nonexistent" / "config.json"
-
-        with (
-            patch("ddogctl.config.get_config_path", return_value=str(config_file)),
-            patch("ddogctl.config.console"),
-            pytest.raises(SystemExit),
-        ):
+        # patched_config_path is never written, so the config file is missing
+        with patch("ddogctl.config.console"), pytest.raises(SystemExit):
             load_config()
 
-    @patch.dict("os.environ", {}, clear=True)
-    def test_profile_site_region_shortcut_expanded(self, tmp_path):
+    def test_profile_site_region_shortcut_expanded(self, clean_dd_env):
         """Test that region shortcuts in profile are expanded."""
-        config_dir = tmp_path / ".ddogctl"
-        config_dir.mkdir(parents=True)
-        config_file = config_dir / "config.json"
-
         config_data = {
             "active_profile": "prod",
-            "profiles": {
-                "prod": {
-                    "api_key": "key",
-                    "app_key": "app",
-                    "site": "eu",
-                }
-            },
+            "profiles": {"prod": {"api_key": "key", "app_key": "app", "site": "eu"}},
         }
-        config_file.write_text(json.dumps(config_data))
 
-        with patch("ddogctl.config.get_config_path", return_value=str(config_file)):
-            config = load_config()
+        config = load_config(config_data=config_data)
 
         assert config.site == "datadoghq.eu"
 
@@ -218,38 +128,16 @@ class TestLoadConfigWithProfiles:
 class TestProfileFlagIntegration:
     """Tests for --profile flag on the main CLI group."""
 
-    @patch.dict("os.environ", {}, clear=True)
-    def test_profile_flag_passes_to_load_config(self, runner, tmp_path):
+    def test_profile_flag_passes_to_load_config(self, runner, cli_main):
         """Test that --profile flag is used when loading config."""
-        from ddogctl.cli import main
-
-        config_dir = tmp_path / ".ddogctl"
-        config_dir.mkdir(parents=True)
-        config_file = config_dir / "config.json"
-
-        config_data = {
-            "active_profile": "prod",
-            "profiles": {
-                "staging": {
-                    "api_key": "staging-key",
-                    "app_key": "staging-app",
-                    "site": "datadoghq.eu",
-                }
-            },
-        }
-        config_file.write_text(json.dumps(config_data))
+        # Stop at config loading; only the profile handed to load_config matters here
+        with patch("ddogctl.config.load_config", side_effect=RuntimeError("stop")) as mock_load:
+            runner.invoke(cli_main, ["--profile", "staging", "monitor", "list"])
 
-        with patch("ddogctl.config.get_config_path", return_value=str(config_file)):
-            # Just test that --profile is accepted as an option
-            result = runner.invoke(main, ["--profile", "staging", "--help"])
+        mock_load.assert_called_once_with(profile="staging")
 
-        # --help should succeed and show help text
-        assert result.exit_code == 0
-
-    def test_profile_flag_shown_in_help(self, runner):
+    def test_profile_flag_shown_in_help(self, runner, cli_main):
         """Test that --profile is listed in CLI help."""
-        from ddogctl.cli import main
-
-        result = runner.invoke(main, ["--help"])
+        result = runner.invoke(cli_main, ["--help"])
         assert result.exit_code == 0
         assert "--profile" in result.output
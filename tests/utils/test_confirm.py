@@ -1,11 +1,18 @@
 """Tests for confirmation utility for destructive operations."""
 
 import click
-from click.testing import CliRunner
+import pytest
 
 from ddogctl.utils.confirm import confirm_action
 
 
+@click.command()
+@click.option("--message", default="Delete monitor 123?")
+def _confirm_cmd(message):
+    result = confirm_action(message, confirmed=False)
+    click.echo("confirmed" if result else "cancelled")
+
+
 class TestConfirmAction:
     """Tests for confirm_action()."""
 
@@ -13,44 +20,20 @@ class TestConfirmAction:
         """When --confirm is passed, skip the prompt and return True."""
         assert confirm_action("Delete monitor 123?", confirmed=True) is True
 
-    def test_prompts_user_when_confirm_flag_not_set(self):
-        """When --confirm not passed, prompt user for confirmation."""
-
-        @click.command()
-        def cmd():
-            result = confirm_action("Delete monitor 123?", confirmed=False)
-            if result:
-                click.echo("confirmed")
-            else:
-                click.echo("cancelled")
-
-        runner = CliRunner()
-        # User types 'y'
-        result = runner.invoke(cmd, input="y\n")
-        assert "confirmed" in result.output
-
-    def test_user_declines_confirmation(self):
-        """When user types 'n', return False."""
-
-        @click.command()
-        def cmd():
-            result = confirm_action("Delete monitor 123?", confirmed=False)
-            if result:
-                click.echo("confirmed")
-            else:
-                click.echo("cancelled")
-
-        runner = CliRunner()
-        result = runner.invoke(cmd, input="n\n")
-        assert "cancelled" in result.output
-
-    def test_prompt_message_is_shown(self):
+    @pytest.mark.parametrize(
+        "user_input,expected",
+        [("y\n", "confirmed"), ("n\n", "cancelled")],
+        ids=["accepts", "declines"],
+    )
+    def test_prompts_user_when_confirm_flag_not_set(self, runner, user_input, expected):
+        """When --confirm not passed, prompt user and return their answer."""
+        result = runner.invoke(_confirm_cmd, input=user_input)
+        assert expected in result.output
+
+    def test_prompt_message_is_shown(self, runner):
         """The confirmation message should appear in the output."""
-
-        @click.command()
-        def cmd():
-            confirm_action("Are you sure you want to delete this?", confirmed=False)
-
-        runner = CliRunner()
-        result = runner.invoke(cmd, input="n\n")
-        assert "Are you sure you want to delete this?" in result.output
+        result = runner.invoke(
+            _confirm_cmd, ["--message", "Mute downtime 456 for all scopes?"], input="n\n"
+        )
+        assert "Mute downtime 456 for all scopes?" in result.output
+        assert "Delete monitor 123?" not in result.output
@@ -1,7 +1,7 @@
 """Tests for error handling utilities."""
 
 import json
-from io import StringIO
+from types import SimpleNamespace
 
 import pytest
 from unittest.mock import patch
@@ -19,128 +19,166 @@ from ddogctl.utils.exit_codes import (
 
 
 @pytest.fixture(autouse=True)
-def reset_output_format():
-    """Reset output format to table after each test."""
-    set_output_format("table")
-    yield
-    set_output_format("table")
+def reset_output_format(monkeypatch):
+    """Start each test in table mode; monkeypatch restores the format afterwards."""
+    monkeypatch.setattr("ddogctl.utils.output._output_format", "table")
+
+
+# Re-raised on every attempt by the always-failing retry tests
+_RATE_LIMIT_EXC = ApiException(status=429, reason="Rate Limited")
+_SERVER_ERR_EXC = ApiException(status=500, reason="Internal Server Error")
+
+
+# Decorated once at import instead of inside every test
+@handle_api_error
+def _succeed():
+    return "success"
+
+
+@handle_api_error
+def _join_args(a, b, c=None):
+    return f"{a}-{b}-{c}"
+
+
+@handle_api_error
+def _raise(exc):
+    raise exc
+
+
+def _printed_matching(mock_console, substr):
+    """Return messages passed to ``mock_console.print`` that contain ``substr``."""
+    calls = mock_console.print.call_args_list
+    return [c[0][0] for c in calls if substr in c[0][0]]
+
+
+def _make_flaky(failures, status, reason):
+    """Build a decorated function that raises ``failures`` ApiExceptions, then succeeds.
+
+    Returns:
+        Tuple of (decorated function, state) where ``state.calls`` counts attempts
+    """
+    state = SimpleNamespace(calls=0)
+
+    @handle_api_error
+    def flaky():
+        state.calls += 1
+        if state.calls <= failures:
+            raise ApiException(status=status, reason=reason)
+        return "success"
+
+    return flaky, state
 
 
 class TestHandleApiError:
     """Test suite for handle_api_error decorator."""
 
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def _error_patches(cls):
+        """Patch console, emit_error and time.sleep once for the whole class."""
+        with (
+            patch("ddogctl.utils.error.console") as console,
+            patch("ddogctl.utils.error.emit_error") as emit_error,
+            patch("ddogctl.utils.error.time.sleep") as sleep,
+        ):
+            yield SimpleNamespace(console=console, emit_error=emit_error, sleep=sleep)
+
+    @pytest.fixture(autouse=True)
+    def _reset_error_patches(self, _error_patches):
+        """Clear calls recorded by earlier tests on the shared mocks."""
+        for mock in vars(_error_patches).values():
+            mock.reset_mock()
+
     @pytest.fixture
-    def mock_console(self):
+    def mock_console(self, _error_patches):
         """Mock rich Console for capturing retry output."""
-        with patch("ddogctl.utils.error.console") as mock:
-            yield mock
+        return _error_patches.console
 
     @pytest.fixture
-    def mock_emit_error(self):
+    def mock_emit_error(self, _error_patches):
         """Mock emit_error for capturing structured error calls."""
-        with patch("ddogctl.utils.error.emit_error") as mock:
-            yield mock
+        return _error_patches.emit_error
 
     @pytest.fixture
-    def mock_sleep(self):
+    def mock_sleep(self, _error_patches):
         """Mock time.sleep to avoid delays in tests."""
-        with patch("ddogctl.utils.error.time.sleep") as mock:
-            yield mock
+        return _error_patches.sleep
 
     def test_successful_call_no_error(self, mock_emit_error):
         """Test that successful function calls work normally."""
 
-        @handle_api_error
-        def successful_func():
-            return "success"
-
-        result = successful_func()
+        result = _succeed()
         assert result == "success"
         mock_emit_error.assert_not_called()
 
     def test_successful_call_with_args_and_kwargs(self, mock_emit_error):
         """Test that decorator preserves function arguments."""
 
-        @handle_api_error
-        def func_with_args(a, b, c=None):
-            return f"{a}-{b}-{c}"
-
-        result = func_with_args("x", "y", c="z")
+        result = _join_args("x", "y", c="z")
         assert result == "x-y-z"
         mock_emit_error.assert_not_called()
 
-    def test_401_authentication_error(self, mock_emit_error):
-        """Test that 401 errors trigger AUTH_FAILED emit_error and exit."""
-
-        @handle_api_error
-        def auth_error_func():
-            raise ApiException(status=401, reason="Unauthorized")
+    @pytest.mark.parametrize(
+        "status,reason,expected_code,expected_exit,expected_message,expected_hint",
+        [
+            (
+                401,
+                "Unauthorized",
+                "AUTH_FAILED",
+                AUTH_ERROR,
+                "authentication failed",
+                "Check DD_API_KEY and DD_APP_KEY or run ddogctl config init",
+            ),
+            (
+                403,
+                "Forbidden",
+                "PERMISSION_DENIED",
+                AUTH_ERROR,
+                "permission denied",
+                "Check API key permissions",
+            ),
+            (404, "Not Found", "NOT_FOUND", NOT_FOUND, "not found", "Verify the resource ID"),
+            (400, "Bad Request", "VALIDATION_ERROR", VALIDATION_ERROR, "validation error", None),
+        ],
+        ids=["401_auth", "403_permission", "404_not_found", "400_validation"],
+    )
+    def test_client_error_exits_without_retry(
+        self,
+        mock_emit_error,
+        mock_sleep,
+        status,
+        reason,
+        expected_code,
+        expected_exit,
+        expected_message,
+        expected_hint,
+    ):
+        """Test that 4xx errors emit a structured error and exit without retrying."""
 
         with pytest.raises(SystemExit) as exc_info:
-            auth_error_func()
+            _raise(ApiException(status=status, reason=reason))
 
-        assert exc_info.value.code == AUTH_ERROR
-        mock_emit_error.assert_called_once_with(
-            "AUTH_FAILED",
-            401,
-            "Authentication failed",
-            "Check DD_API_KEY and DD_APP_KEY or run ddogctl config init",
-        )
-
-    def test_403_permission_error(self, mock_emit_error):
-        """Test that 403 errors trigger PERMISSION_DENIED emit_error and exit."""
-
-        @handle_api_error
-        def permission_error_func():
-            raise ApiException(status=403, reason="Forbidden")
-
-        with pytest.raises(SystemExit) as exc_info:
-            permission_error_func()
-
-        assert exc_info.value.code == AUTH_ERROR
-        mock_emit_error.assert_called_once_with(
-            "PERMISSION_DENIED",
-            403,
-            "Permission denied",
-            "Check API key permissions",
-        )
-
-    def test_404_not_found_error(self, mock_emit_error, mock_sleep):
-        """Test that 404 errors trigger NOT_FOUND emit_error and exit."""
-
-        @handle_api_error
-        def not_found_func():
-            raise ApiException(status=404, reason="Not Found")
-
-        with pytest.raises(SystemExit) as exc_info:
-            not_found_func()
-
-        assert exc_info.value.code == NOT_FOUND
+        assert exc_info.value.code == expected_exit
         mock_sleep.assert_not_called()
         mock_emit_error.assert_called_once()
-        call_args = mock_emit_error.call_args
-        assert call_args[0][0] == "NOT_FOUND"
-        assert call_args[0][1] == 404
-        assert "not found" in call_args[0][2].lower()
-        assert call_args[0][3] == "Verify the resource ID"
+        args = mock_emit_error.call_args[0]
+        assert args[0] == expected_code
+        assert args[1] == status
+        assert expected_message in args[2].lower()
+        if expected_hint is None:
+            assert len(args) == 3
+        else:
+            assert args[3] == expected_hint
 
     def test_429_rate_limit_with_retry(self, mock_console, mock_emit_error, mock_sleep):
         """Test that 429 errors trigger retry with exponential backoff."""
-        call_count = 0
-
-        @handle_api_error
-        def rate_limited_func():
-            nonlocal call_count
-            call_count += 1
-            if call_count < 3:
-                raise ApiException(status=429, reason="Rate Limited")
-            return "success"
+        rate_limited_func, state = _make_flaky(2, 429, "Rate Limited")
 
         result = rate_limited_func()
 
         # Should succeed on third attempt
         assert result == "success"
-        assert call_count == 3
+        assert state.calls == 3
 
         # Should have slept twice (before 2nd and 3rd attempts)
         assert mock_sleep.call_count == 2
@@ -151,8 +189,7 @@ class TestHandleApiError:
 
         # Retry messages go through console.print (not emit_error)
         assert mock_console.print.call_count >= 2
-        print_calls = [c[0][0] for c in mock_console.print.call_args_list]
-        rate_limit_warnings = [c for c in print_calls if "Rate limited" in c]
+        rate_limit_warnings = _printed_matching(mock_console, "Rate limited")
         assert len(rate_limit_warnings) == 2
 
         # emit_error should NOT be called (all retries succeeded)
@@ -161,12 +198,8 @@ class TestHandleApiError:
     def test_429_rate_limit_max_retries_exceeded(self, mock_emit_error, mock_sleep):
         """Test that 429 errors exit after max retries."""
 
-        @handle_api_error
-        def always_rate_limited():
-            raise ApiException(status=429, reason="Rate Limited")
-
         with pytest.raises(SystemExit) as exc_info:
-            always_rate_limited()
+            _raise(_RATE_LIMIT_EXC)
 
         assert exc_info.value.code == RATE_LIMITED
 
@@ -183,59 +216,38 @@ class TestHandleApiError:
 
     def test_500_server_error_with_retry(self, mock_console, mock_emit_error, mock_sleep):
         """Test that 5xx errors trigger retry."""
-        call_count = 0
-
-        @handle_api_error
-        def server_error_func():
-            nonlocal call_count
-            call_count += 1
-            if call_count < 2:
-                raise ApiException(status=500, reason="Internal Server Error")
-            return "success"
+        server_error_func, state = _make_flaky(1, 500, "Internal Server Error")
 
         result = server_error_func()
 
         # Should succeed on second attempt
         assert result == "success"
-        assert call_count == 2
+        assert state.calls == 2
 
         # Should have slept once (before 2nd attempt)
         mock_sleep.assert_called_once_with(1.0)
 
         # Retry messages go through console.print
-        print_calls = [c[0][0] for c in mock_console.print.call_args_list]
-        server_error_warnings = [c for c in print_calls if "Server error" in c]
+        server_error_warnings = _printed_matching(mock_console, "Server error")
         assert len(server_error_warnings) >= 1
 
         # emit_error should NOT be called (retry succeeded)
         mock_emit_error.assert_not_called()
 
-    def test_503_service_unavailable_retry(self, mock_emit_error, mock_sleep):
+    def test_503_service_unavailable_retry(self, mock_emit_error):
         """Test that 503 errors (5xx) trigger retry."""
-        call_count = 0
-
-        @handle_api_error
-        def service_unavailable_func():
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:
-                raise ApiException(status=503, reason="Service Unavailable")
-            return "success"
+        service_unavailable_func, state = _make_flaky(1, 503, "Service Unavailable")
 
         result = service_unavailable_func()
         assert result == "success"
-        assert call_count == 2
+        assert state.calls == 2
         mock_emit_error.assert_not_called()
 
     def test_server_error_max_retries_exceeded(self, mock_emit_error, mock_sleep):
         """Test that server errors exit after max retries."""
 
-        @handle_api_error
-        def always_server_error():
-            raise ApiException(status=500, reason="Internal Server Error")
-
         with pytest.raises(SystemExit) as exc_info:
-            always_server_error()
+            _raise(_SERVER_ERR_EXC)
 
         assert exc_info.value.code == SERVER_ERROR
 
@@ -250,36 +262,11 @@ class TestHandleApiError:
         assert "Server error" in call_args[0][2]
         assert call_args[0][3] == "Datadog service issue, try again later"
 
-    def test_400_client_error_no_retry(self, mock_emit_error, mock_sleep):
-        """Test that 400 errors are treated as validation errors without retry."""
-
-        @handle_api_error
-        def bad_request_func():
-            raise ApiException(status=400, reason="Bad Request")
-
-        with pytest.raises(SystemExit) as exc_info:
-            bad_request_func()
-
-        assert exc_info.value.code == VALIDATION_ERROR
-
-        # Should NOT retry
-        mock_sleep.assert_not_called()
-
-        # Should emit VALIDATION_ERROR
-        mock_emit_error.assert_called_once()
-        call_args = mock_emit_error.call_args
-        assert call_args[0][0] == "VALIDATION_ERROR"
-        assert call_args[0][1] == 400
-
     def test_generic_exception_handling(self, mock_emit_error):
         """Test that non-ApiException errors are caught and logged."""
 
-        @handle_api_error
-        def generic_error_func():
-            raise RuntimeError("Something went wrong")
-
         with pytest.raises(SystemExit) as exc_info:
-            generic_error_func()
+            _raise(RuntimeError("Something went wrong"))
 
         assert exc_info.value.code == GENERAL_ERROR
 
@@ -303,15 +290,8 @@ class TestHandleApiError:
     def test_different_api_exception_messages(self, mock_emit_error):
         """Test that exception messages are included in error output."""
 
-        @handle_api_error
-        def custom_error_func():
-            raise ApiException(
-                status=400,
-                reason="Bad Request",
-            )
-
         with pytest.raises(SystemExit) as exc_info:
-            custom_error_func()
+            _raise(ApiException(status=400, reason="Bad Request"))
 
         assert exc_info.value.code == VALIDATION_ERROR
         call_args = mock_emit_error.call_args
@@ -350,25 +330,16 @@ class TestHandleApiError:
         result = nested_func()
         assert result == "wrapped: test"
 
-    def test_retry_count_tracking(self, mock_console, mock_sleep):
+    def test_retry_count_tracking(self, mock_console):
         """Test that retry attempts are properly tracked in log messages."""
-        call_count = 0
-
-        @handle_api_error
-        def intermittent_server_error():
-            nonlocal call_count
-            call_count += 1
-            # Fail twice, succeed on third
-            if call_count <= 2:
-                raise ApiException(status=500, reason="Server Error")
-            return "success"
+        # Fail twice, succeed on third
+        intermittent_server_error, _ = _make_flaky(2, 500, "Server Error")
 
         result = intermittent_server_error()
         assert result == "success"
 
         # Check that retry messages include attempt numbers
-        print_calls = [c[0][0] for c in mock_console.print.call_args_list]
-        retry_messages = [c for c in print_calls if "Retrying" in c]
+        retry_messages = _printed_matching(mock_console, "Retrying")
 
         # Should have 2 retry messages (for attempts 1 and 2)
         assert len(retry_messages) == 2
@@ -385,12 +356,8 @@ class TestHandleApiError:
         class CustomException(Exception):
             pass
 
-        @handle_api_error
-        def custom_exception_func():
-            raise CustomException("Custom error")
-
         with pytest.raises(SystemExit) as exc_info:
-            custom_exception_func()
+            _raise(CustomException("Custom error"))
 
         assert exc_info.value.code == GENERAL_ERROR
 
@@ -403,114 +370,81 @@ class TestHandleApiError:
 class TestHandleApiErrorJsonMode:
     """Test that handle_api_error produces structured JSON in JSON mode."""
 
+    @pytest.fixture(autouse=True)
+    def _json_mode(self):
+        """Run each test in JSON mode; reset_output_format restores table mode."""
+        set_output_format("json")
+
     @pytest.fixture
     def mock_sleep(self):
-        """Mock time.sleep to avoid delays in tests."""
+        """Mock time.sleep so the 429/5xx cases exhaust their retries instantly."""
         with patch("ddogctl.utils.error.time.sleep") as mock:
             yield mock
 
-    def test_401_json_output(self):
-        """Test 401 error produces JSON on stderr in JSON mode."""
-        set_output_format("json")
-
-        @handle_api_error
-        def auth_error():
-            raise ApiException(status=401, reason="Unauthorized")
-
-        with patch("sys.stderr", new_callable=StringIO) as mock_stderr:
-            with pytest.raises(SystemExit) as exc_info:
-                auth_error()
-
-        assert exc_info.value.code == AUTH_ERROR
-        data = json.loads(mock_stderr.getvalue())
-        assert data["error"] is True
-        assert data["code"] == "AUTH_FAILED"
-        assert data["status"] == 401
-        assert data["hint"] == "Check DD_API_KEY and DD_APP_KEY or run ddogctl config init"
-
-    def test_403_json_output(self):
-        """Test 403 error produces JSON on stderr in JSON mode."""
-        set_output_format("json")
-
-        @handle_api_error
-        def perm_error():
-            raise ApiException(status=403, reason="Forbidden")
-
-        with patch("sys.stderr", new_callable=StringIO) as mock_stderr:
-            with pytest.raises(SystemExit) as exc_info:
-                perm_error()
-
-        assert exc_info.value.code == AUTH_ERROR
-        data = json.loads(mock_stderr.getvalue())
-        assert data["code"] == "PERMISSION_DENIED"
-        assert data["status"] == 403
-
-    def test_404_json_output(self):
-        """Test 404 error produces JSON on stderr in JSON mode."""
-        set_output_format("json")
-
-        @handle_api_error
-        def not_found_error():
-            raise ApiException(status=404, reason="Not Found")
-
-        with patch("sys.stderr", new_callable=StringIO) as mock_stderr:
-            with pytest.raises(SystemExit) as exc_info:
-                not_found_error()
-
-        assert exc_info.value.code == NOT_FOUND
-        data = json.loads(mock_stderr.getvalue())
-        assert data["code"] == "NOT_FOUND"
-        assert data["status"] == 404
-        assert data["hint"] == "Verify the resource ID"
-
-    def test_429_exhausted_json_output(self, mock_sleep):
-        """Test 429 after max retries produces JSON on stderr."""
-        set_output_format("json")
-
-        @handle_api_error
-        def rate_limited():
-            raise ApiException(status=429, reason="Rate Limited")
-
-        with patch("sys.stderr", new_callable=StringIO) as mock_stderr:
-            with pytest.raises(SystemExit) as exc_info:
-                rate_limited()
-
-        assert exc_info.value.code == RATE_LIMITED
-        data = json.loads(mock_stderr.getvalue())
-        assert data["code"] == "RATE_LIMITED"
-        assert data["status"] == 429
-
-    def test_500_exhausted_json_output(self, mock_sleep):
-        """Test 500 after max retries produces JSON on stderr."""
-        set_output_format("json")
-
-        @handle_api_error
-        def server_error():
-            raise ApiException(status=500, reason="Internal Server Error")
+    @pytest.fixture
+    def mock_emit_error(self):
+        """Mock emit_error; only the unexpected-error test runs the real serializer."""
+        with patch("ddogctl.utils.error.emit_error") as mock:
+            yield mock
 
-        with patch("sys.stderr", new_callable=StringIO) as mock_stderr:
-            with pytest.raises(SystemExit) as exc_info:
-                server_error()
+    @pytest.mark.parametrize(
+        "exc,expected_code,expected_exit,expected_hint",
+        [
+            (
+                ApiException(status=401, reason="Unauthorized"),
+                "AUTH_FAILED",
+                AUTH_ERROR,
+                "Check DD_API_KEY and DD_APP_KEY or run ddogctl config init",
+            ),
+            (
+                ApiException(status=403, reason="Forbidden"),
+                "PERMISSION_DENIED",
+                AUTH_ERROR,
+                "Check API key permissions",
+            ),
+            (
+                ApiException(status=404, reason="Not Found"),
+                "NOT_FOUND",
+                NOT_FOUND,
+                "Verify the resource ID",
+            ),
+            (
+                _RATE_LIMIT_EXC,
+                "RATE_LIMITED",
+                RATE_LIMITED,
+                "Try again later or reduce request frequency",
+            ),
+            (
+                _SERVER_ERR_EXC,
+                "SERVER_ERROR",
+                SERVER_ERROR,
+                "Datadog service issue, try again later",
+            ),
+        ],
+        ids=["401", "403", "404", "429", "500"],
+    )
+    def test_http_error_json_output(
+        self, mock_emit_error, mock_sleep, exc, expected_code, expected_exit, expected_hint
+    ):
+        """Test HTTP errors emit the structured code, status and hint in JSON mode."""
 
-        assert exc_info.value.code == SERVER_ERROR
-        data = json.loads(mock_stderr.getvalue())
-        assert data["code"] == "SERVER_ERROR"
-        assert data["status"] == 500
+        with pytest.raises(SystemExit) as exc_info:
+            _raise(exc)
 
-    def test_unexpected_error_json_output(self):
-        """Test unexpected error produces JSON on stderr."""
-        set_output_format("json")
+        assert exc_info.value.code == expected_exit
+        code, status, _message, hint = mock_emit_error.call_args.args
+        assert code == expected_code
+        assert status == exc.status
+        assert hint == expected_hint
 
-        @handle_api_error
-        def unexpected():
-            raise RuntimeError("boom")
+    def test_unexpected_error_json_output(self, capsys):
+        """Test unexpected error produces valid JSON on stderr end to end."""
 
-        with patch("sys.stderr", new_callable=StringIO) as mock_stderr:
-            with pytest.raises(SystemExit) as exc_info:
-                unexpected()
+        with pytest.raises(SystemExit) as exc_info:
+            _raise(RuntimeError("boom"))
 
         assert exc_info.value.code == GENERAL_ERROR
-        data = json.loads(mock_stderr.getvalue())
+        data = json.loads(capsys.readouterr().err)
         assert data["code"] == "UNEXPECTED_ERROR"
         assert data["status"] == 0
         assert "boom" in data["message"]
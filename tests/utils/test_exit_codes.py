@@ -1,5 +1,7 @@
 """Tests for semantic exit codes."""
 
+import pytest
+
 from ddogctl.utils.exit_codes import (
     SUCCESS,
     GENERAL_ERROR,
@@ -36,32 +38,20 @@ class TestExitCodeConstants:
 
 
 class TestExitCodeForStatus:
-    def test_401_returns_auth_error(self):
-        assert exit_code_for_status(401) == AUTH_ERROR
-
-    def test_403_returns_auth_error(self):
-        assert exit_code_for_status(403) == AUTH_ERROR
-
-    def test_404_returns_not_found(self):
-        assert exit_code_for_status(404) == NOT_FOUND
-
-    def test_400_returns_validation_error(self):
-        assert exit_code_for_status(400) == VALIDATION_ERROR
-
-    def test_422_returns_validation_error(self):
-        assert exit_code_for_status(422) == VALIDATION_ERROR
-
-    def test_429_returns_rate_limited(self):
-        assert exit_code_for_status(429) == RATE_LIMITED
-
-    def test_500_returns_server_error(self):
-        assert exit_code_for_status(500) == SERVER_ERROR
-
-    def test_502_returns_server_error(self):
-        assert exit_code_for_status(502) == SERVER_ERROR
-
-    def test_503_returns_server_error(self):
-        assert exit_code_for_status(503) == SERVER_ERROR
-
-    def test_unknown_status_returns_general_error(self):
-        assert exit_code_for_status(418) == GENERAL_ERROR
+    @pytest.mark.parametrize(
+        "status,expected",
+        [
+            (401, AUTH_ERROR),
+            (403, AUTH_ERROR),
+            (404, NOT_FOUND),
+            (400, VALIDATION_ERROR),
+            (422, VALIDATION_ERROR),
+            (429, RATE_LIMITED),
+            (500, SERVER_ERROR),
+            (502, SERVER_ERROR),
+            (503, SERVER_ERROR),
+            (418, GENERAL_ERROR),
+        ],
+    )
+    def test_status_maps_to_exit_code(self, status, expected):
+        assert exit_code_for_status(status) == expected
@@ -1,6 +1,7 @@
 """Tests for export output utility (dict → JSON file)."""
 
 import json
+from datetime import datetime
 
 from ddogctl.utils.export import export_to_json
 
@@ -28,6 +29,19 @@ class TestExportToJson:
         loaded = json.loads(output.read_text())
         assert loaded == data
 
+    def test_list_output_matches_single_document_layout(self, tmp_path):
+        """Element-by-element list export yields the same text as a one-shot dump."""
+        data = [
+            {"name": "mon1", "tags": ["env:prod"], "created": datetime(2026, 1, 15, 10, 30)},
+            {"name": "Latência — café", "options": {}},
+            [],
+        ]
+        output = tmp_path / "monitors.json"
+
+        export_to_json(data, str(output))
+
+        assert output.read_text() == json.dumps(data, indent=2, default=str) + "\n"
+
     def test_output_is_pretty_printed(self, tmp_path):
         """Exported JSON should be indented for readability."""
         data = {"key": "value"}
@@ -63,8 +77,6 @@ class TestExportToJson:
 
     def test_handles_datetime_serialization(self, tmp_path):
         """Handle non-serializable types gracefully using default=str."""
-        from datetime import datetime
-
         data = {"timestamp": datetime(2026, 1, 15, 10, 30, 0)}
         output = tmp_path / "out.json"
 
@@ -1,52 +1,81 @@
 """Tests for JSON file input parsing utility."""
 
 import json
+import math
+from types import SimpleNamespace
+
 import pytest
 
 from ddogctl.utils.file_input import load_json_file, load_json_option
 
+MONITOR = {"type": "metric alert", "query": "avg:system.cpu.user{*} > 90", "name": "CPU High"}
+MONITORS = [{"name": "mon1"}, {"name": "mon2"}]
+BIG_INT = 123456789012345678901234567890
+
+
+@pytest.fixture(scope="session")
+def json_files(tmp_path_factory):
+    """Read-only input files written once and shared by the tests."""
+    data_dir = tmp_path_factory.mktemp("json_input")
+    files = SimpleNamespace(
+        monitor=data_dir / "monitor.json",
+        monitors=data_dir / "monitors.json",
+        bad=data_dir / "bad.json",
+        empty=data_dir / "empty.json",
+        big_int=data_dir / "big_int.json",
+        non_finite=data_dir / "non_finite.json",
+    )
+    files.monitor.write_text(json.dumps(MONITOR))
+    files.monitors.write_text(json.dumps(MONITORS))
+    files.bad.write_text("{not valid json}")
+    files.empty.write_text("")
+    files.big_int.write_text(json.dumps({"id": BIG_INT}))
+    files.non_finite.write_text(
+        json.dumps({"nan": float("nan"), "inf": float("inf"), "huge": float("1e400")})
+    )
+    return files
+
 
 class TestLoadJsonFile:
     """Tests for load_json_file()."""
 
-    def test_loads_valid_json_file(self, tmp_path):
+    def test_loads_valid_json_file(self, json_files):
         """Load a valid JSON file and return dict."""
-        data = {"type": "metric alert", "query": "avg:system.cpu.user{*} > 90", "name": "CPU High"}
-        f = tmp_path / "monitor.json"
-        f.write_text(json.dumps(data))
+        result = load_json_file(str(json_files.monitor))
+        assert result == MONITOR
 
-        result = load_json_file(str(f))
-        assert result == data
-
-    def test_loads_json_array(self, tmp_path):
+    def test_loads_json_array(self, json_files):
         """Load a JSON file with an array at the root."""
-        data = [{"name": "mon1"}, {"name": "mon2"}]
-        f = tmp_path / "monitors.json"
-        f.write_text(json.dumps(data))
-
-        result = load_json_file(str(f))
-        assert result == data
+        result = load_json_file(str(json_files.monitors))
+        assert result == MONITORS
+
+    def test_keeps_big_integers_exact(self, json_files):
+        """Integers wider than 64 bits stay exact ints."""
+        result = load_json_file(str(json_files.big_int))
+        assert result == {"id": BIG_INT}
+        assert isinstance(result["id"], int)
+
+    def test_accepts_non_finite_numbers(self, json_files):
+        """NaN and Infinity written by json.dumps (as export does) load back."""
+        result = load_json_file(str(json_files.non_finite))
+        assert math.isnan(result["nan"])
+        assert result["inf"] == math.inf
+        assert result["huge"] == math.inf
 
     def test_raises_on_missing_file(self):
         """Raise FileNotFoundError for nonexistent file."""
         with pytest.raises(FileNotFoundError):
             load_json_file("/nonexistent/path/monitor.json")
 
-    def test_raises_on_invalid_json(self, tmp_path):
+    def test_raises_on_invalid_json(self, json_files):
         """Raise ValueError for malformed JSON."""
-        f = tmp_path / "bad.json"
-        f.write_text("{not valid json}")
-
         with pytest.raises(ValueError, match="Invalid JSON"):
-            load_json_file(str(f))
+            load_json_file(str(json_files.bad))
 
-    def test_raises_on_empty_file(self, tmp_path):
+    def test_raises_on_empty_file(self, json_files):
         """Raise ValueError for empty file."""
-        f = tmp_path / "empty.json"
-        f.write_text("")
-
         with pytest.raises(ValueError, match="Invalid JSON"):
-            load_json_file(str(f))
+            load_json_file(str(json_files.empty))
 
 
 class TestLoadJsonOption:
@@ -57,14 +86,10 @@ class TestLoadJsonOption:
         result = load_json_option(None, None, None)
         assert result is None
 
-    def test_loads_file_and_returns_dict(self, tmp_path):
+    def test_loads_file_and_returns_dict(self, json_files):
         """Load file via Click callback and return parsed dict."""
-        data = {"name": "test monitor"}
-        f = tmp_path / "monitor.json"
-        f.write_text(json.dumps(data))
-
-        result = load_json_option(None, None, str(f))
-        assert result == data
+        result = load_json_option(None, None, str(json_files.monitor))
+        assert result == MONITOR
 
     def test_raises_bad_parameter_on_missing_file(self):
         """Raise click.BadParameter for missing file."""
@@ -73,12 +98,9 @@ class TestLoadJsonOption:
         with pytest.raises(click.BadParameter, match="not found"):
             load_json_option(None, None, "/nonexistent/file.json")
 
-    def test_raises_bad_parameter_on_invalid_json(self, tmp_path):
+    def test_raises_bad_parameter_on_invalid_json(self, json_files):
         """Raise click.BadParameter for malformed JSON."""
         import click
 
-        f = tmp_path / "bad.json"
-        f.write_text("{bad json}")
-
         with pytest.raises(click.BadParameter, match="Invalid JSON"):
-            load_json_option(None, None, str(f))
+            load_json_option(None, None, str(json_files.bad))
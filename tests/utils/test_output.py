@@ -1,8 +1,7 @@
 """Tests for output format utilities."""
 
 import json
-from io import StringIO
-from unittest.mock import patch
+from unittest.mock import Mock
 
 import pytest
 
@@ -10,10 +9,9 @@ from ddogctl.utils.output import emit_error, get_output_format, set_output_forma
 
 
 @pytest.fixture(autouse=True)
-def reset_output_format():
-    """Reset output format to table after each test."""
-    yield
-    set_output_format("table")
+def reset_output_format(monkeypatch):
+    """Start each test in table mode; monkeypatch restores the format afterwards."""
+    monkeypatch.setattr("ddogctl.utils.output._output_format", "table")
 
 
 class TestOutputFormat:
@@ -38,13 +36,19 @@ class TestOutputFormat:
 class TestEmitError:
     """Test suite for emit_error function."""
 
-    def test_json_format_outputs_to_stderr(self):
+    @pytest.fixture
+    def stub_console(self, monkeypatch):
+        """Replace the shared stderr console with a Mock."""
+        console = Mock()
+        monkeypatch.setattr("ddogctl.utils.output._stderr_console", console)
+        return console
+
+    def test_json_format_outputs_to_stderr(self, capsys):
         """Test that JSON mode outputs structured error JSON to stderr."""
         set_output_format("json")
-        with patch("sys.stderr", new_callable=StringIO) as mock_stderr:
-            emit_error("AUTH_FAILED", 401, "Auth failed", "Check keys")
+        emit_error("AUTH_FAILED", 401, "Auth failed", "Check keys")
 
-        output = mock_stderr.getvalue()
+        output = capsys.readouterr().err
         data = json.loads(output)
         assert data["error"] is True
         assert data["code"] == "AUTH_FAILED"
@@ -52,13 +56,12 @@ class TestEmitError:
         assert data["message"] == "Auth failed"
         assert data["hint"] == "Check keys"
 
-    def test_json_format_without_hint(self):
+    def test_json_format_without_hint(self, capsys):
         """Test that JSON mode omits hint field when not provided."""
         set_output_format("json")
-        with patch("sys.stderr", new_callable=StringIO) as mock_stderr:
-            emit_error("API_ERROR", 400, "Bad request")
+        emit_error("API_ERROR", 400, "Bad request")
 
-        output = mock_stderr.getvalue()
+        output = capsys.readouterr().err
         data = json.loads(output)
         assert data["error"] is True
         assert data["code"] == "API_ERROR"
@@ -66,18 +69,17 @@ class TestEmitError:
         assert data["message"] == "Bad request"
         assert "hint" not in data
 
-    def test_json_format_with_zero_status(self):
+    def test_json_format_with_zero_status(self, capsys):
         """Test JSON output with zero status for non-API errors."""
         set_output_format("json")
-        with patch("sys.stderr", new_callable=StringIO) as mock_stderr:
-            emit_error("UNEXPECTED_ERROR", 0, "Something broke")
+        emit_error("UNEXPECTED_ERROR", 0, "Something broke")
 
-        output = mock_stderr.getvalue()
+        output = capsys.readouterr().err
         data = json.loads(output)
         assert data["status"] == 0
         assert data["code"] == "UNEXPECTED_ERROR"
 
-    def test_json_format_all_error_codes(self):
+    def test_json_format_all_error_codes(self, capsys):
         """Test that all defined error codes produce valid JSON output."""
         set_output_format("json")
         error_codes = [
@@ -90,44 +92,48 @@ class TestEmitError:
             ("UNEXPECTED_ERROR", 0),
         ]
         for code, status in error_codes:
-            with patch("sys.stderr", new_callable=StringIO) as mock_stderr:
-                emit_error(code, status, f"Test {code}")
-            data = json.loads(mock_stderr.getvalue())
+            emit_error(code, status, f"Test {code}")
+            data = json.loads(capsys.readouterr().err)
             assert data["code"] == code
             assert data["status"] == status
 
-    def test_table_format_uses_rich(self):
+    def test_table_format_uses_rich(self, stub_console):
         """Test that table mode outputs via Rich console without error."""
         set_output_format("table")
-        with patch("rich.console.Console") as mock_console_cls:
-            mock_console = mock_console_cls.return_value
-            emit_error("AUTH_FAILED", 401, "Auth failed", "Check keys")
+        emit_error("AUTH_FAILED", 401, "Auth failed", "Check keys")
 
-        mock_console_cls.assert_called_once_with(stderr=True)
-        assert mock_console.print.call_count == 2
+        assert stub_console.print.call_count == 2
         # First call: error message
-        error_call = mock_console.print.call_args_list[0][0][0]
+        error_call = stub_console.print.call_args_list[0][0][0]
         assert "Auth failed" in error_call
         # Second call: hint
-        hint_call = mock_console.print.call_args_list[1][0][0]
+        hint_call = stub_console.print.call_args_list[1][0][0]
         assert "Check keys" in hint_call
 
-    def test_table_format_without_hint(self):
+    def test_table_format_without_hint(self, stub_console):
         """Test that table mode skips hint line when not provided."""
         set_output_format("table")
-        with patch("rich.console.Console") as mock_console_cls:
-            mock_console = mock_console_cls.return_value
-            emit_error("API_ERROR", 400, "Bad request")
+        emit_error("API_ERROR", 400, "Bad request")
 
-        mock_console.print.assert_called_once()
-        call_arg = mock_console.print.call_args[0][0]
+        stub_console.print.assert_called_once()
+        call_arg = stub_console.print.call_args[0][0]
         assert "Bad request" in call_arg
 
-    def test_json_output_is_single_line(self):
+    def test_stderr_console_is_reused(self, monkeypatch):
+        """Test that table mode builds the stderr console once and reuses it."""
+        mock_console_cls = Mock()
+        monkeypatch.setattr("ddogctl.utils.output._stderr_console", None)
+        monkeypatch.setattr("rich.console.Console", mock_console_cls)
+        emit_error("API_ERROR", 400, "First")
+        emit_error("API_ERROR", 400, "Second")
+
+        mock_console_cls.assert_called_once_with(stderr=True)
+        assert mock_console_cls.return_value.print.call_count == 2
+
+    def test_json_output_is_single_line(self, capsys):
         """Test that JSON output is a single line (no pretty printing)."""
         set_output_format("json")
-        with patch("sys.stderr", new_callable=StringIO) as mock_stderr:
-            emit_error("AUTH_FAILED", 401, "Auth failed", "Check keys")
+        emit_error("AUTH_FAILED", 401, "Auth failed", "Check keys")
 
-        output = mock_stderr.getvalue().strip()
+        output = capsys.readouterr().err.strip()
         assert "\n" not in output
@@ -2,6 +2,11 @@
 
 from ddogctl.utils.tags import parse_tags, format_tags_for_display
 
+# 100 distinct tags for the large-input test
+_LONG_TAGS = [f"tag{i}:value{i}" for i in range(100)]
+_LONG_TAGS_STR = ",".join(_LONG_TAGS)
+_LONG_TAGS_SORTED = sorted(_LONG_TAGS)
+
 
 class TestParseTags:
     """Test suite for parse_tags function."""
@@ -118,15 +123,11 @@ class TestParseTags:
 
     def test_very_long_tag_string(self):
         """Test parsing a large number of tags."""
-        # Create 100 tags
-        tags_list = [f"tag{i}:value{i}" for i in range(100)]
-        tags_str = ",".join(tags_list)
-
-        result = parse_tags(tags_str)
+        result = parse_tags(_LONG_TAGS_STR)
 
         assert len(result) == 100
         # Should be sorted
-        assert result == sorted(tags_list)
+        assert result == _LONG_TAGS_SORTED
 
     def test_tags_with_spaces_in_values(self):
         """Test that tags with spaces in values are preserved."""
@@ -1,69 +1,90 @@
 """Tests for watch_loop utility."""
 
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
+
+import pytest
 
 from ddogctl.utils.watch import watch_loop
 
 
-def test_watch_loop_calls_render_func():
+def _make_render():
+    """Build a render function that returns fixed output and counts its calls in ``.n``."""
+
+    def render():
+        render.n += 1
+        return "test output"
+
+    render.n = 0
+    return render
+
+
+@pytest.fixture
+def stopped_sleep(monkeypatch):
+    """Make time.sleep record its interval and raise KeyboardInterrupt to exit the loop."""
+    calls = []
+
+    def sleep(interval):
+        calls.append(interval)
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr("ddogctl.utils.watch.time.sleep", sleep)
+    return calls
+
+
+@pytest.fixture
+def live_mock(monkeypatch):
+    """Replace Rich Live; returns (Live class mock, live instance entered by the loop)."""
+    live = Mock()
+    live_class = Mock()
+    live_class.return_value.__enter__ = Mock(return_value=live)
+    live_class.return_value.__exit__ = Mock(return_value=False)
+    monkeypatch.setattr("ddogctl.utils.watch.Live", live_class)
+    return live_class, live
+
+
+def test_watch_loop_calls_render_func(stopped_sleep):
     """Test that watch_loop calls the render function at least once."""
-    render_func = Mock(return_value="test output")
+    render_func = _make_render()
 
-    # Make time.sleep raise KeyboardInterrupt to exit the loop after first iteration
-    with patch("ddogctl.utils.watch.time.sleep", side_effect=KeyboardInterrupt):
-        watch_loop(render_func, interval=30)
+    watch_loop(render_func, interval=30)
 
-    render_func.assert_called_once()
+    assert render_func.n == 1
 
 
-def test_watch_loop_uses_live_display():
+def test_watch_loop_uses_live_display(stopped_sleep, live_mock):
     """Test that watch_loop uses Rich Live for display."""
-    render_func = Mock(return_value="test output")
+    render_func = _make_render()
+    _, mock_live = live_mock
 
-    with patch("ddogctl.utils.watch.time.sleep", side_effect=KeyboardInterrupt):
-        with patch("ddogctl.utils.watch.Live") as mock_live_class:
-            mock_live = Mock()
-            mock_live_class.return_value.__enter__ = Mock(return_value=mock_live)
-            mock_live_class.return_value.__exit__ = Mock(return_value=False)
+    watch_loop(render_func, interval=30)
 
-            watch_loop(render_func, interval=30)
+    # Verify Live.update was called with render output
+    mock_live.update.assert_called_once_with("test output")
 
-            # Verify Live.update was called with render output
-            mock_live.update.assert_called_once_with("test output")
 
-
-def test_watch_loop_sleeps_for_interval():
+def test_watch_loop_sleeps_for_interval(stopped_sleep):
     """Test that watch_loop sleeps for the specified interval."""
-    render_func = Mock(return_value="test output")
-
-    with patch("ddogctl.utils.watch.time.sleep", side_effect=KeyboardInterrupt) as mock_sleep:
-        watch_loop(render_func, interval=10)
+    watch_loop(_make_render(), interval=10)
 
-    mock_sleep.assert_called_once_with(10)
+    assert stopped_sleep == [10]
 
 
-def test_watch_loop_default_interval():
+def test_watch_loop_default_interval(stopped_sleep):
     """Test that watch_loop defaults to 30 second interval."""
-    render_func = Mock(return_value="test output")
+    watch_loop(_make_render())
 
-    with patch("ddogctl.utils.watch.time.sleep", side_effect=KeyboardInterrupt) as mock_sleep:
-        watch_loop(render_func)
+    assert stopped_sleep == [30]
 
-    mock_sleep.assert_called_once_with(30)
 
-
-def test_watch_loop_handles_keyboard_interrupt():
+def test_watch_loop_handles_keyboard_interrupt(stopped_sleep):
     """Test that watch_loop exits cleanly on KeyboardInterrupt."""
-    render_func = Mock(return_value="test output")
-
-    with patch("ddogctl.utils.watch.time.sleep", side_effect=KeyboardInterrupt):
-        # Should not raise an exception
-        watch_loop(render_func, interval=5)
+    # Should not raise an exception
+    watch_loop(_make_render(), interval=5)
 
 
-def test_watch_loop_multiple_iterations():
+def test_watch_loop_multiple_iterations(monkeypatch):
     """Test that watch_loop calls render_func on each iteration."""
-    render_func = Mock(return_value="test output")
+    render_func = _make_render()
     call_count = 0
 
     def sleep_side_effect(interval):
@@ -71,38 +92,28 @@ def test_watch_loop_multiple_iterations():
         call_count += 1
         if call_count >= 3:
             raise KeyboardInterrupt
-        return None
 
-    with patch("ddogctl.utils.watch.time.sleep", side_effect=sleep_side_effect):
-        watch_loop(render_func, interval=5)
+    monkeypatch.setattr("ddogctl.utils.watch.time.sleep", sleep_side_effect)
+    watch_loop(render_func, interval=5)
 
     # Should be called 3 times (initial + 2 more before KeyboardInterrupt on 3rd sleep)
-    assert render_func.call_count == 3
+    assert render_func.n == 3
 
 
-def test_watch_loop_clamps_minimum_interval():
+def test_watch_loop_clamps_minimum_interval(stopped_sleep):
     """Test that watch_loop clamps interval to minimum 1 second."""
-    render_func = Mock(return_value="test output")
+    watch_loop(_make_render(), interval=0)
 
-    with patch("ddogctl.utils.watch.time.sleep", side_effect=KeyboardInterrupt) as mock_sleep:
-        watch_loop(render_func, interval=0)
+    assert stopped_sleep == [1]
 
-    mock_sleep.assert_called_once_with(1)
 
-
-def test_watch_loop_accepts_custom_console():
+def test_watch_loop_accepts_custom_console(stopped_sleep, live_mock):
     """Test that watch_loop accepts a custom console."""
-    render_func = Mock(return_value="test output")
     custom_console = Mock()
+    mock_live_class, _ = live_mock
 
-    with patch("ddogctl.utils.watch.time.sleep", side_effect=KeyboardInterrupt):
-        with patch("ddogctl.utils.watch.Live") as mock_live_class:
-            mock_live = Mock()
-            mock_live_class.return_value.__enter__ = Mock(return_value=mock_live)
-            mock_live_class.return_value.__exit__ = Mock(return_value=False)
-
-            watch_loop(render_func, interval=30, console=custom_console)
+    watch_loop(_make_render(), interval=30, console=custom_console)
 
-            mock_live_class.assert_called_once()
-            call_kwargs = mock_live_class.call_args
-            assert call_kwargs[1]["console"] == custom_console
+    mock_live_class.assert_called_once()
+    call_kwargs = mock_live_class.call_args
+    assert call_kwargs[1]["console"] == custom_console